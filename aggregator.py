@@ -1,19 +1,36 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import gc
 import json
 import logging
+import logging.handlers
 import os
 import sys
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 import string
+from typing import Callable, Iterator, Optional
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401  (backs the string dtype and the Parquet copy)
+except ImportError:
+    pyarrow = None
+
 from sentiment import add_sentiment_columns, choose_text_column
 
 
+# Text columns are held as Arrow strings (one contiguous buffer per column) when
+# pyarrow is available, falling back to pandas' own string dtype otherwise.
+_STRING_DTYPE = "string[pyarrow]" if pyarrow is not None else "string"
+
+
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
@@ -37,9 +54,13 @@ def setup_logging(output_dir: str, level: str = "INFO") -> logging.Logger:
     ch.setFormatter(fmt)
     logger.addHandler(ch)
 
+    # Buffer file writes: flush every 200 records, immediately on ERROR+, and at
+    # the end of each cycle, rather than a write per record from the retry warnings.
     fh = logging.FileHandler(os.path.join(output_dir, "monitor.log"), encoding="utf-8")
     fh.setFormatter(fmt)
-    logger.addHandler(fh)
+    mh = logging.handlers.MemoryHandler(capacity=200, flushLevel=logging.ERROR, target=fh)
+    logger.addHandler(mh)
+    atexit.register(mh.flush)
 
     return logger
 
@@ -65,18 +86,58 @@ def retry(
     raise RuntimeError(f"{label} failed after {attempts} attempts: {last_err}")
 
 
-def _to_datetime_utc(val: object) -> Optional[pd.Timestamp]:
-    if val is None:
-        return None
-    if isinstance(val, float) and pd.isna(val):
-        return None
-    try:
-        # Unix timestamp (Reddit created_utc)
-        if isinstance(val, (int, float)) and float(val) > 10_000:
-            return pd.to_datetime(val, unit="s", utc=True, errors="coerce")
-        return pd.to_datetime(val, utc=True, errors="coerce")
-    except Exception:
-        return None
+def _to_datetime_series(s: pd.Series, unit_seconds: bool = False) -> pd.Series:
+    """
+    Parse a whole timestamp column to UTC in one vectorized call (bad values -> NaT).
+
+    The conversion path is picked once from the column dtype, never per row.
+    """
+    if pd.api.types.is_datetime64_any_dtype(s):
+        # Already parsed (e.g. demo frames); only make sure it is UTC.
+        return s.dt.tz_convert("UTC") if s.dt.tz is not None else s.dt.tz_localize("UTC")
+    if unit_seconds:
+        # Unix timestamp (Reddit created_utc); numeric columns skip the to_numeric pass.
+        seconds = s if pd.api.types.is_numeric_dtype(s) else pd.to_numeric(s, errors="coerce")
+        return pd.to_datetime(seconds, unit="s", utc=True, errors="coerce")
+    return pd.to_datetime(s, utc=True, errors="coerce", format="ISO8601")
+
+
+# Relevance vocabulary for `_relevance_mask`.
+_EXCLUDE_PATTERNS = (
+    "matik tuwing", "matik na", "matik ang", "matik sa", "matik mo", "matik ko",  # Filipino
+    "mathematics", "math problem", "math help",  # Generic math, not the app
+)
+_INCLUDE_PATTERNS = (
+    "matiks app", "matiks application", "matiks game", "matiks math", "matiks review",
+    "matiks internship", "matiks company", "matiks team", "play matiks", "using matiks",
+    "matiks daily", "matiks practice", "matiks learning", "matiks education",
+)
+_APP_WORDS = ("app", "application", "game", "play", "download", "install", "review", "rating", "update", "version")
+_COMPANY_WORDS = ("company", "team", "internship", "job", "work", "career", "education", "learning", "practice")
+
+
+def _alternation(words: tuple[str, ...]) -> re.Pattern:
+    # Plain alternation (no word boundaries) so it matches exactly like `word in text`.
+    return re.compile("|".join(map(re.escape, words)))
+
+
+_EXCLUDE_RX = _alternation(_EXCLUDE_PATTERNS)
+_INCLUDE_RX = _alternation(_INCLUDE_PATTERNS)
+_CONTEXT_RX = _alternation(_APP_WORDS + _COMPANY_WORDS)
+
+
+def _relevance_mask(text: pd.Series) -> pd.Series:
+    """
+    Relevance of a whole text column: must name "matiks", must not hit an exclude
+    pattern, and needs an include pattern, a repeated "matiks", or app/company context.
+    """
+    tl = text.fillna("").astype(_STRING_DTYPE).str.lower()
+    has_matiks = tl.str.contains("matiks", regex=False)
+    excluded = tl.str.contains(_EXCLUDE_RX, regex=True)
+    included = tl.str.contains(_INCLUDE_RX, regex=True)
+    multi = tl.str.count("matiks") > 1
+    context = tl.str.contains(_CONTEXT_RX, regex=True)
+    return has_matiks & ~excluded & (included | multi | context)
 
 
 def is_matiks_relevant(text: str) -> bool:
@@ -86,303 +147,439 @@ def is_matiks_relevant(text: str) -> bool:
     """
     if not text or pd.isna(text):
         return False
-    
-    text_lower = str(text).lower()
-    
-    # Must contain "matiks" as the brand name (not just "matik")
-    if "matiks" not in text_lower:
-        return False
-    
-    # Exclude posts that are likely about other topics
-    exclude_patterns = [
-        "matik tuwing",  # Filipino phrase
-        "matik na",      # Filipino 
-        "matik ang",     # Filipino
-        "matik sa",      # Filipino
-        "matik mo",      # Filipino
-        "matik ko",      # Filipino
-        "mathematics",   # General math, not the app
-        "math problem",  # Generic math problems
-        "math help",     # Generic math help
-    ]
-    
-    for pattern in exclude_patterns:
-        if pattern in text_lower:
-            return False
-    
-    # Include patterns that indicate it's about the app/company
-    include_patterns = [
-        "matiks app",
-        "matiks application", 
-        "matiks game",
-        "matiks math",
-        "matiks review",
-        "matiks internship",
-        "matiks company",
-        "matiks team",
-        "play matiks",
-        "using matiks",
-        "matiks daily",
-        "matiks practice",
-        "matiks learning",
-        "matiks education"
-    ]
-    
-    # If any include pattern is found, it's relevant
-    for pattern in include_patterns:
-        if pattern in text_lower:
-            return True
-    
-    # If "matiks" appears multiple times, it's more likely relevant
-    if text_lower.count("matiks") > 1:
-        return True
-    
-    # If it contains app-related words with "matiks", it's likely relevant
-    app_words = ["app", "application", "game", "play", "download", "install", "review", "rating", "update", "version"]
-    if any(word in text_lower for word in app_words):
-        return True
-    
-    # If it contains company/education words with "matiks", it's likely relevant  
-    company_words = ["company", "team", "internship", "job", "work", "career", "education", "learning", "practice"]
-    if any(word in text_lower for word in company_words):
-        return True
-    
-    # Default: if it just mentions "matiks" once without context, exclude it
-    return False
+    return bool(_relevance_mask(pd.Series([str(text)])).iloc[0])
+
+
+# Unified schema produced by every normalizer, in output order.
+UNIFIED_COLUMNS = [
+    "platform",
+    "type",
+    "author",
+    "url",
+    "timestamp",
+    "engagement_likes",
+    "engagement_comments",
+    "engagement_shares",
+    "text",
+    "rating",
+    "app_version",
+]
+
+# Unified column -> raw collector column, per platform. Unified columns that a
+# source doesn't provide are filled with the constant from `_UNIFIED_DEFAULTS`.
+_SOURCE_COLUMNS: dict[str, dict[str, str]] = {
+    "Reddit": {
+        "author": "author",
+        "url": "url",
+        "timestamp": "created_utc",
+        "engagement_likes": "score",  # Reddit uses score as likes
+        "engagement_comments": "num_comments",
+    },
+    "Twitter/X": {
+        "author": "username",
+        "url": "url",
+        "timestamp": "date",
+        "engagement_likes": "likeCount",
+        "engagement_comments": "replyCount",
+        "engagement_shares": "retweetCount",
+        "text": "content",
+    },
+    "LinkedIn": {
+        "author": "author",
+        "url": "url",
+        "timestamp": "timestamp",
+        "engagement_likes": "engagement_likes",
+        "engagement_comments": "engagement_comments",
+        "text": "content",
+    },
+    "Google Play": {
+        "author": "author",
+        "timestamp": "date",
+        "text": "review_text",
+        "rating": "rating",
+        "app_version": "version",
+    },
+    "Apple App Store": {
+        "author": "author",
+        "timestamp": "date",
+        "text": "review_text",
+        "rating": "rating",
+        "app_version": "version",
+    },
+}
+
+# Dtype a raw column is created with when a collector didn't return it.
+_SOURCE_DTYPES: dict[str, str] = {
+    "timestamp": "object",
+    "engagement_likes": "int64",
+    "engagement_comments": "int64",
+    "engagement_shares": "int64",
+}
+
+# Raw column -> dtype, per platform; see `_ensure_cols`.
+_SOURCE_SCHEMAS: dict[str, dict[str, str]] = {
+    platform: {src: _SOURCE_DTYPES.get(col, _STRING_DTYPE) for col, src in mapping.items()}
+    for platform, mapping in _SOURCE_COLUMNS.items()
+}
+
+# Unified columns carried as `_STRING_DTYPE` from normalization through rendering.
+_STRING_COLUMNS = ("author", "url", "text", "rating", "app_version")
+
+# Raw timestamp columns holding Unix epoch seconds rather than ISO-8601 strings.
+_EPOCH_SECONDS_COLUMNS = frozenset({"created_utc"})
+
+_UNIFIED_DEFAULTS: dict[str, object] = {
+    "author": "",
+    "url": "",  # App store reviews don't have URLs
+    "engagement_likes": 0,  # App store reviews don't have engagement metrics
+    "engagement_comments": 0,
+    "engagement_shares": 0,  # Reddit/LinkedIn/reviews have no share counts
+    "text": "",
+    "rating": "",  # Social media doesn't have ratings
+    "app_version": "",  # Social media doesn't have app versions
+}
+
+
+def _ensure_cols(df: pd.DataFrame, spec: dict[str, str]) -> pd.DataFrame:
+    """
+    Return `df` with every column in `spec` present, so normalizers can index directly.
+
+    Missing columns are added with the given dtype ("" for text, 0 for ints,
+    null otherwise); existing columns are left untouched.
+    """
+    missing = {c: dt for c, dt in spec.items() if c not in df.columns}
+    if not missing:
+        return df
+    fills = {_STRING_DTYPE: "", "int64": 0}
+    return df.assign(
+        **{c: pd.Series(fills.get(dt), index=df.index, dtype=dt) for c, dt in missing.items()}
+    )
+
+
+# Fixed categories for the low-cardinality columns. Every frame shares the same
+# dtype, so concatenating sources (and history + new rows) stays categorical.
+_PLATFORM_DTYPE = pd.CategoricalDtype(list(_SOURCE_COLUMNS))
+_TYPE_DTYPE = pd.CategoricalDtype(["review", "social"])
+_LABEL_DTYPE = pd.CategoricalDtype(["negative", "neutral", "positive"])
+
+
+def _constant_categorical(value: str, dtype: pd.CategoricalDtype, index: pd.Index) -> pd.Series:
+    """Constant categorical column: one int8 code per row instead of a string pointer."""
+    codes = np.full(len(index), dtype.categories.get_loc(value), dtype=np.int8)
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=dtype), index=index)
+
+
+def _constant_column(col: str, index: pd.Index) -> pd.Series:
+    """Default-filled column for a field the source doesn't provide, typed rather than object."""
+    if col in _STRING_COLUMNS:
+        return pd.Series(_UNIFIED_DEFAULTS[col], index=index, dtype=_STRING_DTYPE)
+    # Engagement counters: a packed int32 zero array instead of one Python int per row.
+    return pd.Series(np.zeros(len(index), dtype=np.int32), index=index)
+
+
+def _unified_frame(
+    df: pd.DataFrame,
+    *,
+    platform: str,
+    kind: str,
+    overrides: Optional[dict[str, pd.Series]] = None,
+    relevance_text: Optional[pd.Series] = None,
+) -> pd.DataFrame:
+    """
+    Build the unified frame column-by-column from `df`.
+
+    When `relevance_text` is given, rows (and overrides) are first narrowed to
+    Matiks-relevant content; an empty frame is returned if nothing survives.
+    Columns stay as Series end to end; columns a source lacks are typed
+    constant arrays (see `_constant_column`).
+    """
+    if relevance_text is not None:
+        relevant_mask = _relevance_mask(relevance_text)
+        df = df[relevant_mask]
+        if df.empty:
+            return pd.DataFrame()
+        overrides = {k: v[relevant_mask] for k, v in (overrides or {}).items()}
+
+    source = _SOURCE_COLUMNS[platform]
+    cols: dict[str, object] = {
+        "platform": _constant_categorical(platform, _PLATFORM_DTYPE, df.index),
+        "type": _constant_categorical(kind, _TYPE_DTYPE, df.index),
+    }
+    for col in UNIFIED_COLUMNS[2:]:
+        src = source.get(col)
+        if col == "timestamp":
+            cols[col] = _to_datetime_series(df[src], unit_seconds=src in _EPOCH_SECONDS_COLUMNS)
+        elif src is None:
+            cols[col] = _constant_column(col, df.index)
+        else:
+            cols[col] = df[src].fillna(_UNIFIED_DEFAULTS[col])
+    cols.update(overrides or {})
+    for col in _STRING_COLUMNS:
+        if isinstance(cols[col], pd.Series):
+            cols[col] = cols[col].astype(_STRING_DTYPE)
+    return pd.DataFrame(cols, index=df.index, copy=False).reset_index(drop=True)
 
 
 def normalize_reddit(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
     
-    title = df.get("title", "").fillna("").astype(str) if "title" in df.columns else ""
-    content = df.get("content", "").fillna("").astype(str) if "content" in df.columns else ""
+    df = _ensure_cols(df, {**_SOURCE_SCHEMAS["Reddit"], "title": _STRING_DTYPE, "content": _STRING_DTYPE})
+    title = df["title"].fillna("").astype(_STRING_DTYPE)
+    content = df["content"].fillna("").astype(_STRING_DTYPE)
     text = (title + "\n" + content).str.strip()
     
-    # Filter for Matiks-relevant content only
-    relevant_mask = text.apply(is_matiks_relevant)
-    df = df[relevant_mask]
-    text = text[relevant_mask]
-    
-    if df.empty:
-        return pd.DataFrame()
-    
-    data = {
-        "platform": ["Reddit"] * len(df),
-        "type": ["social"] * len(df),
-        "author": df.get("author", "").fillna("").tolist(),
-        "url": df.get("url", "").fillna("").tolist(),
-        "timestamp": df.get("created_utc", "").apply(_to_datetime_utc).tolist(),
-        "engagement_likes": df.get("score", 0).fillna(0).tolist(),  # Reddit uses score as likes
-        "engagement_comments": df.get("num_comments", 0).fillna(0).tolist(),
-        "engagement_shares": [0] * len(df),  # Reddit doesn't have shares
-        "text": text.tolist(),
-        "rating": [""] * len(df),  # Social media doesn't have ratings
-        "app_version": [""] * len(df),  # Social media doesn't have app versions
-    }
-    return pd.DataFrame(data)
+    return _unified_frame(df, platform="Reddit", kind="social", overrides={"text": text}, relevance_text=text)
 
 
 def normalize_twitter(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
     
-    # Filter for Matiks-relevant content only
-    text = df.get("content", "").fillna("")
-    relevant_mask = text.apply(is_matiks_relevant)
-    df = df[relevant_mask]
-    
-    if df.empty:
-        return pd.DataFrame()
-    
-    data = {
-        "platform": ["Twitter/X"] * len(df),
-        "type": ["social"] * len(df),
-        "author": df.get("username", "").fillna("").tolist(),
-        "url": df.get("url", "").fillna("").tolist(),
-        "timestamp": df.get("date", "").apply(_to_datetime_utc).tolist(),
-        "engagement_likes": df.get("likeCount", 0).fillna(0).tolist(),
-        "engagement_comments": df.get("replyCount", 0).fillna(0).tolist(),
-        "engagement_shares": df.get("retweetCount", 0).fillna(0).tolist(),
-        "text": df.get("content", "").fillna("").tolist(),
-        "rating": [""] * len(df),  # Social media doesn't have ratings
-        "app_version": [""] * len(df),  # Social media doesn't have app versions
-    }
-    return pd.DataFrame(data)
+    df = _ensure_cols(df, _SOURCE_SCHEMAS["Twitter/X"])
+    return _unified_frame(df, platform="Twitter/X", kind="social", relevance_text=df["content"])
+
+
+def _clean_linkedin_urls(urls: pd.Series) -> pd.Series:
+    """Remove DuckDuckGo redirects and overly long URLs, keeping clean LinkedIn URLs."""
+    urls = urls.fillna("").astype(str)
+    conditions = [
+        # DuckDuckGo redirect (with or without http) -> placeholder
+        urls.str.contains("duckduckgo.com", regex=False).to_numpy(dtype=bool),
+        # Already a clean LinkedIn URL -> keep it
+        urls.str.startswith("https://www.linkedin.com").to_numpy(dtype=bool),
+        # Any other long URL -> placeholder
+        (urls.str.len() > 100).to_numpy(dtype=bool),
+    ]
+    choices = ["https://www.linkedin.com/", urls.to_numpy(dtype=object), "https://www.linkedin.com/"]
+    return pd.Series(np.select(conditions, choices, default=urls.to_numpy(dtype=object)), index=urls.index)
 
 
 def normalize_linkedin(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
     
-    # Filter for Matiks-relevant content only
-    text = df.get("content", "").fillna("")
-    relevant_mask = text.apply(is_matiks_relevant)
-    df = df[relevant_mask]
-    
-    if df.empty:
-        return pd.DataFrame()
-    
-    # Clean up URLs - remove DuckDuckGo redirects and keep only clean LinkedIn URLs
-    def clean_url(url):
-        if pd.isna(url) or not url:
-            return ""
-        url_str = str(url)
-        # If it's a DuckDuckGo redirect (with or without http), replace with a placeholder
-        if "duckduckgo.com" in url_str:
-            return "https://www.linkedin.com/"
-        # If it's already a clean LinkedIn URL, keep it
-        if url_str.startswith('https://www.linkedin.com'):
-            return url_str
-        # For any other long URLs, truncate them
-        if len(url_str) > 100:
-            return "https://www.linkedin.com/"
-        return url_str
-    
-    cleaned_urls = df.get("url", "").fillna("").apply(clean_url)
+    df = _ensure_cols(df, _SOURCE_SCHEMAS["LinkedIn"])
+    cleaned_urls = _clean_linkedin_urls(df["url"])
     
-    data = {
-        "platform": ["LinkedIn"] * len(df),
-        "type": ["social"] * len(df),
-        "author": df.get("author", "").fillna("").tolist(),
-        "url": cleaned_urls.tolist(),
-        "timestamp": df.get("timestamp", "").apply(_to_datetime_utc).tolist(),
-        "engagement_likes": df.get("engagement_likes", 0).fillna(0).tolist(),
-        "engagement_comments": df.get("engagement_comments", 0).fillna(0).tolist(),
-        "engagement_shares": [0] * len(df),  # LinkedIn doesn't have share counts in posts
-        "text": df.get("content", "").fillna("").tolist(),
-        "rating": [""] * len(df),  # Social media doesn't have ratings
-        "app_version": [""] * len(df),  # Social media doesn't have app versions
-    }
-    return pd.DataFrame(data)
+    return _unified_frame(
+        df,
+        platform="LinkedIn",
+        kind="social",
+        overrides={"url": cleaned_urls},
+        relevance_text=df["content"],
+    )
 
 
 def normalize_google_play(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
     
-    data = {
-        "platform": ["Google Play"] * len(df),
-        "type": ["review"] * len(df),
-        "author": df.get("author", "").fillna("").tolist(),
-        "url": [""] * len(df),  # App store reviews don't have URLs
-        "timestamp": df.get("date", "").apply(_to_datetime_utc).tolist(),
-        "engagement_likes": [0] * len(df),  # App store reviews don't have engagement metrics
-        "engagement_comments": [0] * len(df),  # App store reviews don't have comment counts
-        "engagement_shares": [0] * len(df),  # Reviews can't be shared
-        "text": df.get("review_text", "").fillna("").tolist(),
-        "rating": df.get("rating", "").fillna("").tolist(),
-        "app_version": df.get("version", "").fillna("").tolist(),
-    }
-    return pd.DataFrame(data)
+    df = _ensure_cols(df, _SOURCE_SCHEMAS["Google Play"])
+    return _unified_frame(df, platform="Google Play", kind="review")
 
 
 def normalize_apple_store(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
     
-    data = {
-        "platform": ["Apple App Store"] * len(df),
-        "type": ["review"] * len(df),
-        "author": df.get("author", "").fillna("").tolist(),
-        "url": [""] * len(df),  # App store reviews don't have URLs
-        "timestamp": df.get("date", "").apply(_to_datetime_utc).tolist(),
-        "engagement_likes": [0] * len(df),  # Apple reviews don't have like counts
-        "engagement_comments": [0] * len(df),  # Apple reviews don't have comment counts
-        "engagement_shares": [0] * len(df),  # Reviews can't be shared
-        "text": df.get("review_text", "").fillna("").tolist(),
-        "rating": df.get("rating", "").fillna("").tolist(),
-        "app_version": df.get("version", "").fillna("").tolist(),
-    }
-    return pd.DataFrame(data)
-
-
-def load_existing_combined(path: str) -> pd.DataFrame:
+    df = _ensure_cols(df, _SOURCE_SCHEMAS["Apple App Store"])
+    return _unified_frame(df, platform="Apple App Store", kind="review")
+
+
+# Column dtypes for reading the combined history back; anything unlisted is inferred.
+_COMBINED_DTYPES = {
+    # Low-cardinality columns are kept as integer-coded categories.
+    "platform": _PLATFORM_DTYPE,
+    "type": _TYPE_DTYPE,
+    "sentiment_label": _LABEL_DTYPE,
+    "author": _STRING_DTYPE,
+    "url": _STRING_DTYPE,
+    "text": _STRING_DTYPE,
+    "rating": _STRING_DTYPE,
+    # Read as text so blanks can still be filled; `_compact_columns` makes it a
+    # category (a handful of release strings repeated across thousands of reviews).
+    "app_version": _STRING_DTYPE,
+}
+
+# Applied once the history is filled (blanks would break a strict int32 CSV read):
+# categories for repetitive text (url stays a string, it's near-unique) and
+# int32 for the engagement counters.
+_COMPACT_DTYPES = {
+    "app_version": "category",
+    "engagement_likes": "int32",
+    "engagement_comments": "int32",
+    "engagement_shares": "int32",
+}
+
+
+def _compact_columns(df: pd.DataFrame) -> None:
+    """Cast columns to `_COMPACT_DTYPES` in place, one column at a time."""
+    for col, dtype in _COMPACT_DTYPES.items():
+        if col not in df.columns:
+            continue
+        if dtype == "int32" and not pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(dtype)
+        elif df[col].dtype != dtype:
+            df[col] = df[col].astype(dtype)
+
+
+def load_existing_combined(path: str, parquet_path: Optional[str] = None) -> pd.DataFrame:
+    """Load the combined history, preferring the Parquet copy over the CSV mirror."""
+    if parquet_path and os.path.exists(parquet_path):
+        try:
+            df = pd.read_parquet(parquet_path, engine="pyarrow")
+            # Parquet metadata restores plain "string"; put back the in-pipeline dtypes.
+            return df.astype({c: dt for c, dt in _COMBINED_DTYPES.items() if c in df.columns})
+        except Exception:
+            pass  # fall back to the CSV mirror below
     if not os.path.exists(path):
         return pd.DataFrame()
     try:
-        df = pd.read_csv(path)
+        # Timestamps are parsed by the C reader itself rather than in a second pass.
+        df = pd.read_csv(
+            path,
+            dtype=_COMBINED_DTYPES,
+            parse_dates=["timestamp"],
+            date_format="ISO8601",
+            engine="c",
+        )
     except Exception:
         return pd.DataFrame()
-    if "timestamp" in df.columns:
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True, errors="coerce")
+    ts = df["timestamp"]
+    if not pd.api.types.is_datetime64_any_dtype(ts):
+        # Mixed UTC offsets come back unparsed; normalize them explicitly.
+        df["timestamp"] = pd.to_datetime(ts, utc=True, errors="coerce", format="ISO8601")
+    elif ts.dt.tz is None:
+        df["timestamp"] = ts.dt.tz_localize("UTC")
     return df
 
 
-def dedupe(df: pd.DataFrame) -> pd.DataFrame:
-    if df is None or df.empty:
-        return df
-    # Remove rows with missing platform first
-    df = df.dropna(subset=["platform"])
-    
-    # Best-effort stable id; for reviews we often don't have a URL.
-    df["__dedupe_key"] = (
-        df.get("platform").astype(str)
-        + "|"
-        + df.get("type").astype(str)
-        + "|"
-        + df.get("url").fillna("").astype(str)
-        + "|"
-        + df.get("author").fillna("").astype(str)
-        + "|"
-        + df.get("timestamp").fillna("").astype(str)
-        + "|"
-        + df.get("text").fillna("").astype(str).str.slice(0, 200)
-    )
-    df = df.drop_duplicates(subset=["__dedupe_key"]).drop(columns=["__dedupe_key"])
-    return df
+def save_combined(
+    df: pd.DataFrame,
+    path: str,
+    parquet_path: Optional[str],
+    logger: logging.Logger,
+    *,
+    new_rows: Optional[pd.DataFrame] = None,
+) -> None:
+    """
+    Write the combined history as Parquet (typed, compressed) plus a CSV mirror.
 
+    With `new_rows`, the CSV is appended to rather than rewritten when its header
+    already matches; the Parquet copy (the load source) is always written in full.
+    """
+    if parquet_path:
+        # Arrow needs one type per column; mixed object columns (e.g. rating: 5 / "") are
+        # cast to the same dtypes the CSV reader uses, defaulting to strings.
+        obj_cols = df.select_dtypes(include="object").columns
+        try:
+            df.astype({c: _COMBINED_DTYPES.get(c, _STRING_DTYPE) for c in obj_cols}).to_parquet(
+                parquet_path, engine="pyarrow", compression="zstd", index=False
+            )
+        except Exception as e:
+            logger.warning("Parquet write failed, keeping CSV only: %s", e)
+    # CSV mirror for external consumers, written last.
+    if new_rows is not None and os.path.exists(path):
+        try:
+            header = pd.read_csv(path, nrows=0).columns.tolist()
+        except Exception:
+            header = []
+        if sorted(header) == sorted(df.columns):
+            if not new_rows.empty:
+                new_rows.reindex(columns=header).to_csv(path, mode="a", header=False, index=False)
+            return
+    df.to_csv(path, index=False)
 
-def render_dashboard_html(df: pd.DataFrame, out_path: str, *, title: str = "Matiks Monitor") -> None:
-    df2 = df.copy()
-    if "timestamp" in df2.columns:
-        df2["timestamp"] = pd.to_datetime(df2["timestamp"], utc=True, errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S UTC")
 
-    # Keep columns in a predictable order.
-    cols = [
-        "platform",
-        "type",
-        "timestamp",
-        "author",
-        "text",
-        "rating",
-        "app_version",
-        "engagement_likes",
-        "engagement_comments",
-        "engagement_shares",
-        "sentiment_label",
-        "sentiment_polarity",
-        "url",
-    ]
-    for c in cols:
-        if c not in df2.columns:
-            df2[c] = pd.NA
-    df2 = df2[cols]
+_DEDUPE_COLUMNS = ["platform", "type", "url", "author", "timestamp"]
 
-    df2 = df2.rename(
-        columns={
-            "platform": "Platform",
-            "type": "Type",
-            "timestamp": "Timestamp (UTC)",
-            "author": "Author",
-            "text": "Content",
-            "rating": "Rating",
-            "app_version": "App Version",
-            "engagement_likes": "Likes",
-            "engagement_comments": "Comments",
-            "engagement_shares": "Shares",
-            "sentiment_label": "Sentiment",
-            "sentiment_polarity": "Sentiment Polarity",
-            "url": "URL",
-        }
+
+def _dedupe_key(df: pd.DataFrame) -> pd.Series:
+    """
+    One uint64 hash per row over the dedupe columns plus a 200-char text prefix.
+
+    Everything is hashed as text so the key doesn't depend on how a column was
+    typed (category vs object, CSV vs Parquet round trip).
+    """
+    parts = {c: df[c].astype(str).where(df[c].notna(), "") for c in _DEDUPE_COLUMNS}
+    parts["text_prefix"] = df["text"].astype(str).where(df["text"].notna(), "").str.slice(0, 200)
+    return pd.util.hash_pandas_object(pd.DataFrame(parts, index=df.index), index=False)
+
+
+def load_seen_keys(path: str, existing: pd.DataFrame) -> np.ndarray:
+    """
+    Sorted dedupe keys of the saved history.
+
+    Read from the sidecar when it still lines up with `existing` (one key per
+    row, since the history is saved de-duplicated); otherwise rebuilt from it.
+    """
+    if os.path.exists(path):
+        try:
+            keys = np.load(path)
+            if len(keys) == len(existing):
+                return keys
+        except Exception:
+            pass  # unreadable sidecar, rebuild below
+    if existing is None or existing.empty:
+        return np.empty(0, dtype=np.uint64)
+    return np.unique(_dedupe_key(existing).to_numpy())
+
+
+def dedupe_new(new_df: pd.DataFrame, seen_keys: np.ndarray) -> tuple[pd.DataFrame, np.ndarray]:
+    """
+    Keep only rows of `new_df` not already in the history or repeated in the batch.
+
+    Returns the kept rows and the updated sorted key set, so the history itself
+    never needs re-hashing.
+    """
+    if new_df is None or new_df.empty:
+        return new_df, seen_keys
+    new_df = new_df.dropna(subset=["platform"])
+    keys = _dedupe_key(new_df)
+    fresh = ~keys.duplicated() & ~np.isin(keys.to_numpy(), seen_keys)
+    return new_df[fresh], np.union1d(seen_keys, keys[fresh].to_numpy())
+
+
+def save_seen_keys(path: str, keys: np.ndarray) -> None:
+    with open(path, "wb") as f:
+        np.save(f, keys)
+
+
+def _escaped_cells(col: pd.Series, *, line_breaks: bool = False) -> np.ndarray:
+    """HTML-escape a whole column at once; missing values render as empty cells."""
+    text = col.astype(str).where(col.notna(), "")
+    text = (
+        text.str.replace("&", "&amp;", regex=False)
+        .str.replace("<", "&lt;", regex=False)
+        .str.replace(">", "&gt;", regex=False)
     )
+    if line_breaks:
+        # Real newlines and literal "\\n" sequences both display as line breaks.
+        text = text.str.replace("\\n", "<br>", regex=False).str.replace("\n", "<br>", regex=False)
+    return text.to_numpy(dtype=object)
 
-    table_html = df2.to_html(index=False, escape=True, border=0, table_id="data")
-    
-    # Replace literal \n with <br> for better display
-    table_html = table_html.replace('\\n', '<br>')
 
-    html = """<!doctype html>
+def _iter_table_chunks(
+    df: pd.DataFrame,
+    *,
+    table_id: str,
+    line_break_columns: tuple[str, ...] = (),
+    rows_per_chunk: int = 10_000,
+) -> Iterator[str]:
+    """Yield a plain `<table>` for `df` in pieces; cells are escaped column-wise per batch of rows."""
+    head = "".join(f"<th>{name}</th>" for name in _escaped_cells(pd.Series(df.columns)))
+    yield f'<table class="dataframe" id="{table_id}">\n<thead><tr>{head}</tr></thead>\n<tbody>\n'
+    for start in range(0, len(df), rows_per_chunk):
+        part = df.iloc[start : start + rows_per_chunk]
+        cols = [_escaped_cells(part[c], line_breaks=c in line_break_columns) for c in part.columns]
+        yield "".join("<tr>" + "".join(f"<td>{cell}</td>" for cell in cells) + "</tr>\n" for cells in zip(*cols))
+    yield "</tbody>\n</table>"
+
+
+# Dashboard page around the data table. Braces are doubled for str.format; the
+# table itself is streamed between the head and tail halves.
+_DASHBOARD_TEMPLATE = """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
@@ -756,12 +953,109 @@ def render_dashboard_html(df: pd.DataFrame, out_path: str, *, title: str = "Mati
 </body>
 </html>
 """
+_HEAD_TMPL, _TAIL_TMPL = _DASHBOARD_TEMPLATE.split("{TABLE_HTML}")
+_TAIL_HTML = _TAIL_TMPL.format()
+
+
+def render_dashboard_html(df: pd.DataFrame, out_path: str, *, title: str = "Matiks Monitor") -> None:
+    df2 = df.copy()
+    if "timestamp" in df2.columns:
+        df2["timestamp"] = pd.to_datetime(df2["timestamp"], utc=True, errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+    # Keep columns in a predictable order.
+    cols = [
+        "platform",
+        "type",
+        "timestamp",
+        "author",
+        "text",
+        "rating",
+        "app_version",
+        "engagement_likes",
+        "engagement_comments",
+        "engagement_shares",
+        "sentiment_label",
+        "sentiment_polarity",
+        "url",
+    ]
+    for c in cols:
+        if c not in df2.columns:
+            df2[c] = pd.NA
+    df2 = df2[cols]
+
+    df2 = df2.rename(
+        columns={
+            "platform": "Platform",
+            "type": "Type",
+            "timestamp": "Timestamp (UTC)",
+            "author": "Author",
+            "text": "Content",
+            "rating": "Rating",
+            "app_version": "App Version",
+            "engagement_likes": "Likes",
+            "engagement_comments": "Comments",
+            "engagement_shares": "Shares",
+            "sentiment_label": "Sentiment",
+            "sentiment_polarity": "Sentiment Polarity",
+            "url": "URL",
+        }
+    )
+
+    # Stream head, table rows and tail straight to disk instead of building the page in memory.
+    with open(out_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(_HEAD_TMPL.format(TITLE=title, UTC_NOW=utc_now_iso()))
+        for chunk in _iter_table_chunks(df2, table_id="data", line_break_columns=("Content",)):
+            f.write(chunk)
+        f.write(_TAIL_HTML)
+
+
+
+_SENTIMENT_COLUMNS = ("sentiment_polarity", "sentiment_subjectivity", "sentiment_label")
 
-    html = html.format(TITLE=title, UTC_NOW=utc_now_iso(), TABLE_HTML=table_html)
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(html)
+def run_once(*, query: str, output_dir: str, limit: int, logger: logging.Logger) -> pd.DataFrame:
+    from social.reddit import fetch_reddit_mentions_json, fetch_reddit_mentions_demo
+    from social.twitter_fixed import fetch_twitter_mentions
+    from social.linkedin_fixed import fetch_linkedin_mentions
+    from appstore.google_play import fetch_google_play_reviews, fetch_google_play_reviews_demo
+    from appstore.apple_store import fetch_apple_store_reviews, fetch_apple_store_reviews_demo
 
+    # Fetch from all sources concurrently; each keeps its own retry/backoff.
+    fetches = [
+        ("Reddit", lambda: fetch_reddit_mentions_json(query=query, limit=limit), 3),
+        ("Twitter API", lambda: fetch_twitter_mentions(query=query, limit=limit), 1),
+        ("LinkedIn API", lambda: fetch_linkedin_mentions(query=query, limit=limit), 1),
+        ("Google Play", lambda: fetch_google_play_reviews(count=limit), 3),
+        # Apple's RSS pages retry at the HTTP level: pages the concurrent httpx prefetch
+        # misses are refetched through the retrying requests session, so no outer retry.
+        ("Apple Store", lambda: fetch_apple_store_reviews(count=limit), 1),
+    ]
+    raw: dict[str, pd.DataFrame] = {}
+    with ThreadPoolExecutor(max_workers=len(fetches)) as ex:
+        futures = {
+            ex.submit(retry, fn, attempts=attempts, logger=logger, label=label): label
+            for label, fn, attempts in fetches
+        }
+        for fut in as_completed(futures):
+            raw[futures[fut]] = fut.result()
+
+    # Normalize; the sources are independent and the pandas/NumPy string
+    # kernels release the GIL, so run them side by side.
+    tasks = [
+        (normalize_reddit, raw["Reddit"]),
+        (normalize_twitter, raw["Twitter API"]),
+        (normalize_linkedin, raw["LinkedIn API"]),
+        (normalize_google_play, raw["Google Play"]),
+        (normalize_apple_store, raw["Apple Store"]),
+    ]
+    with ThreadPoolExecutor(max_workers=len(tasks)) as ex:
+        futures = [ex.submit(fn, df) for fn, df in tasks]
+        all_dfs = [f.result() for f in futures]
+    del raw, tasks  # raw collector frames are no longer needed
+
+    # Combine
+    combined = pd.concat([df for df in all_dfs if not df.empty], ignore_index=True, copy=False)
+    return combined
 
 
 def main() -> int:
@@ -778,53 +1072,54 @@ def main() -> int:
     ensure_output_dir(args.output_dir)
 
     combined_csv = os.path.join(args.output_dir, "combined.csv")
+    combined_parquet = os.path.join(args.output_dir, "combined.parquet")
+    combined_keys = os.path.join(args.output_dir, "combined.keys.npy")
     dashboard_html = os.path.join(args.output_dir, "dashboard.html")
     status_json = os.path.join(args.output_dir, "last_run.json")
 
-    def run_once(*, query: str, output_dir: str, limit: int, logger: logging.Logger) -> pd.DataFrame:
-        from social.reddit import fetch_reddit_mentions_json, fetch_reddit_mentions_demo
-        from social.twitter_fixed import fetch_twitter_mentions
-        from social.linkedin_fixed import fetch_linkedin_mentions
-        from appstore.google_play import fetch_google_play_reviews, fetch_google_play_reviews_demo
-        from appstore.apple_store import fetch_apple_store_reviews, fetch_apple_store_reviews_demo
-
-        # Fetch from all sources
-        reddit_df = retry(lambda: fetch_reddit_mentions_json(query=query, limit=limit), attempts=3, logger=logger, label="Reddit")
-        twitter_df = retry(lambda: fetch_twitter_mentions(query=query, limit=limit), attempts=1, logger=logger, label="Twitter API")
-        linkedin_df = retry(lambda: fetch_linkedin_mentions(query=query, limit=limit), attempts=1, logger=logger, label="LinkedIn API")
-        google_df = retry(lambda: fetch_google_play_reviews(count=limit), attempts=3, logger=logger, label="Google Play")
-        apple_df = retry(lambda: fetch_apple_store_reviews(count=limit), attempts=3, logger=logger, label="Apple Store")
-
-        # Normalize
-        reddit_norm = normalize_reddit(reddit_df)
-        twitter_norm = normalize_twitter(twitter_df)
-        linkedin_norm = normalize_linkedin(linkedin_df)
-        google_norm = normalize_google_play(google_df)
-        apple_norm = normalize_apple_store(apple_df)
-
-        # Combine
-        all_dfs = [reddit_norm, twitter_norm, linkedin_norm, google_norm, apple_norm]
-        combined = pd.concat([df for df in all_dfs if not df.empty], ignore_index=True)
-        return combined
-
     def _cycle():
         started = utc_now_iso()
         try:
             new_df = run_once(query=args.query, output_dir=args.output_dir, limit=args.limit, logger=logger)
-            existing = load_existing_combined(combined_csv)
-            all_df = pd.concat([existing, new_df], ignore_index=True) if not existing.empty else new_df
-            all_df["timestamp"] = pd.to_datetime(all_df["timestamp"], utc=True, errors="coerce")
+            existing = load_existing_combined(combined_csv, combined_parquet)
+            # De-dupe only the new batch against the persisted key set of the history.
+            seen_keys = load_seen_keys(combined_keys, existing)
+            new_df, seen_keys = dedupe_new(new_df, seen_keys)
+            if not new_df.empty:
+                new_df = new_df.sort_values(by=["timestamp"], ascending=False, na_position="last", kind="stable")
+            if existing.empty:
+                all_df = new_df
+            elif new_df.empty:
+                all_df = existing
+            else:
+                all_df = pd.concat([existing, new_df], ignore_index=True, copy=False)
+            n_existing, n_new = len(existing), len(new_df)
+            # all_df holds everything from here on; drop the inputs so they don't
+            # stay alive (and double peak memory) through sentiment/sort/save.
+            del existing, new_df
+            if not isinstance(all_df["timestamp"].dtype, pd.DatetimeTZDtype):
+                # Both sides are normally tz-aware already; only re-parse a mixed column.
+                all_df["timestamp"] = pd.to_datetime(all_df["timestamp"], utc=True, errors="coerce", cache=True)
             
-            # Add sentiment analysis to ALL data (not just new data)
+            # Sentiment is deterministic per text, so only score rows that don't
+            # have a label yet; the first run (no sentiment columns) scores everything.
             text_col = choose_text_column(all_df)
-            if text_col:
+            if text_col and "sentiment_label" in all_df.columns:
+                unscored = all_df["sentiment_label"].isna()
+                if unscored.any():
+                    scored = add_sentiment_columns(all_df.loc[unscored].copy(), text_col=text_col)
+                    for col in _SENTIMENT_COLUMNS:
+                        all_df.loc[unscored, col] = scored[col]
+                    del scored
+            elif text_col:
                 all_df = add_sentiment_columns(all_df, text_col=text_col)
             
-            all_df = dedupe(all_df)
-            all_df = all_df.sort_values(by=["timestamp"], ascending=False, na_position="last")
+            # The history is saved sorted and new_df is sorted above, so this only merges
+            # two sorted runs, which timsort ("stable") does in a single linear pass.
+            all_df = all_df.sort_values(by=["timestamp"], ascending=False, na_position="last", kind="stable")
             
             # Replace all NaN values with appropriate defaults before saving
-            all_df = all_df.fillna({
+            all_df.fillna({
                 'url': '',
                 'engagement_likes': 0,
                 'engagement_comments': 0, 
@@ -833,31 +1128,47 @@ def main() -> int:
                 'app_version': '',
                 'author': '',
                 'text': ''
-            })
+            }, inplace=True)
+            _compact_columns(all_df)
+
+            # Return the intermediates freed above before the write path allocates its own.
+            gc.collect()
 
             # Save combined data
-            all_df.to_csv(combined_csv, index=False)
-            logger.info(f"Saved combined data to {combined_csv} ({len(all_df)} rows)")
+            # Rows past the history's length came from this run (concat used ignore_index).
+            save_combined(
+                all_df,
+                combined_csv,
+                combined_parquet,
+                logger,
+                new_rows=all_df[all_df.index >= n_existing],
+            )
+            save_seen_keys(combined_keys, seen_keys)
+            logger.info(f"Saved combined data to {combined_parquet} and {combined_csv} ({len(all_df)} rows)")
 
             # Update status file
             update_status_file(len(all_df), logger)
 
-            # Render dashboard
-            render_dashboard_html(all_df, dashboard_html)
-            logger.info(f"Rendered dashboard to {dashboard_html}")
+            # Render dashboard (unchanged data keeps the existing page)
+            if n_new > 0 or not os.path.exists(dashboard_html):
+                render_dashboard_html(all_df, dashboard_html)
+                logger.info(f"Rendered dashboard to {dashboard_html}")
+            else:
+                logger.info("No new rows; keeping %s", dashboard_html)
 
             status = {
                 "ok": True,
                 "started_at": started,
                 "finished_at": utc_now_iso(),
                 "rows_total": int(len(all_df)),
-                "rows_new": int(len(new_df)),
+                "rows_new": int(n_new),
                 "combined_csv": os.path.abspath(combined_csv),
+                "combined_parquet": os.path.abspath(combined_parquet),
                 "dashboard_html": os.path.abspath(dashboard_html),
             }
             with open(status_json, "w", encoding="utf-8") as f:
                 json.dump(status, f, indent=2)
-            logger.info("Run finished (new=%d, total=%d)", len(new_df), len(all_df))
+            logger.info("Run finished (new=%d, total=%d)", n_new, len(all_df))
         except Exception as e:
             status = {
                 "ok": False,
@@ -868,6 +1179,10 @@ def main() -> int:
             with open(status_json, "w", encoding="utf-8") as f:
                 json.dump(status, f, indent=2)
             logger.exception("Run failed: %s", e)
+        finally:
+            # Get this cycle's buffered records into monitor.log before the scheduler idles.
+            for handler in logger.handlers:
+                handler.flush()
 
     if args.once:
         _cycle()
@@ -1,44 +1,117 @@
+import hashlib
 import json
 import sys
 import os
+import time
 from pathlib import Path
 
 # Add the root directory to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
+# How long a rendered dashboard is served before the sources are fetched again.
+CACHE_TTL_S = int(os.getenv("MATIKS_CACHE_TTL", "300"))
+# After a failed refresh, how long the stale page is served before trying again.
+ERROR_RETRY_S = int(os.getenv("MATIKS_ERROR_RETRY", "30"))
+
+# Last good dashboard for this (warm) function instance, plus the stale copy
+# served after a failed refresh.
+_cache = {"html": None, "etag": None, "ts": 0.0, "stale": None, "failed_at": 0.0}
+
+STALE_BANNER = (
+    '<div style="background:#fff3cd;color:#664d03;padding:8px 12px;font-family:sans-serif">'
+    "Showing cached data: the latest refresh failed.</div>"
+)
+
+
+def _html_response(html, *, cache_control=None, etag=None):
+    headers = {
+        'Content-Type': 'text/html; charset=utf-8',
+        'Cache-Control': cache_control
+        or f'public, max-age={CACHE_TTL_S}, stale-while-revalidate={2 * CACHE_TTL_S}',
+    }
+    if etag:
+        headers['ETag'] = etag
+    return {
+        'statusCode': 200,
+        'headers': headers,
+        'body': html
+    }
+
+
+def _cached_response(request):
+    """Serve the cached page, or a bodyless 304 when the client already has it."""
+    etag = _cache["etag"]
+    headers = getattr(request, "headers", None) or {}
+    if etag and headers.get("If-None-Match") == etag:
+        return {'statusCode': 304, 'headers': {'ETag': etag}, 'body': ''}
+    return _html_response(_cache["html"], etag=etag)
+
+
+def _with_stale_banner(html):
+    if "<body>" in html:
+        return html.replace("<body>", "<body>" + STALE_BANNER, 1)
+    return STALE_BANNER + html
+
+
+def _stale_response(html):
+    return _html_response(_with_stale_banner(html), cache_control='no-cache')
+
+
 def handler(request):
     """Vercel serverless function handler"""
+    now = time.time()
+    if _cache["html"] is not None and now - _cache["ts"] < CACHE_TTL_S:
+        return _cached_response(request)
+    if _cache["stale"] is not None and now - _cache["failed_at"] < ERROR_RETRY_S:
+        # A refresh just failed; don't hit the sources again on every request.
+        return _stale_response(_cache["stale"])
+
+    # Set up output directory
+    output_dir = Path(__file__).parent.parent / "output"
+    dashboard_path = output_dir / "dashboard.html"
+
     try:
         # Import the aggregator
-        from aggregator import run_once, setup_logging
-        import pandas as pd
-        
-        # Set up output directory
-        output_dir = Path(__file__).parent.parent / "output"
+        from aggregator import render_dashboard_html, run_once, setup_logging
+        from sentiment import add_sentiment_columns, choose_text_column
+
         output_dir.mkdir(exist_ok=True)
-        
-        # Run the aggregation
-        logger = setup_logging(str(output_dir))
-        df = run_once(query="Matiks", output_dir=str(output_dir), limit=20, logger=logger)
-        
+
+        # A dashboard written within the TTL (e.g. by the scheduled run) is served
+        # as is; only run the aggregation when it is older than that.
+        if not (dashboard_path.exists() and now - dashboard_path.stat().st_mtime < CACHE_TTL_S):
+            logger = setup_logging(str(output_dir))
+            df = run_once(query="Matiks", output_dir=str(output_dir), limit=20, logger=logger)
+            # run_once only collects; score and render this batch here.
+            text_col = choose_text_column(df)
+            if text_col:
+                df = add_sentiment_columns(df, text_col=text_col)
+            render_dashboard_html(df, str(dashboard_path))
+
         # Read the dashboard HTML
-        dashboard_path = output_dir / "dashboard.html"
         if dashboard_path.exists():
             with open(dashboard_path, 'r', encoding='utf-8') as f:
                 dashboard_html = f.read()
         else:
             dashboard_html = "<h1>Dashboard not found. Please run the aggregator first.</h1>"
-        
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'text/html; charset=utf-8',
-                'Cache-Control': 'no-cache, no-store, must-revalidate',
-            },
-            'body': dashboard_html
-        }
-        
+
+        _cache["html"] = dashboard_html
+        _cache["etag"] = '"%s"' % hashlib.md5(dashboard_html.encode("utf-8")).hexdigest()
+        _cache["ts"] = now
+        _cache["stale"] = None
+        return _cached_response(request)
+
     except Exception as e:
+        # Upstream failure: fall back to the last good copy (memory, then disk).
+        stale = _cache["html"]
+        if stale is None and dashboard_path.exists():
+            with open(dashboard_path, 'r', encoding='utf-8') as f:
+                stale = f.read()
+        if stale is not None:
+            _cache["stale"] = stale
+            _cache["failed_at"] = now
+            return _stale_response(stale)
+
         import traceback
         error_html = f"""
         <h1>Error</h1>
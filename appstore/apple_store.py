@@ -9,13 +9,32 @@ Note: Apple's review API often returns empty/non-JSON (block or changed API);
 demo data keeps the pipeline running. Swap in official App Store Connect API
 if you have developer access.
 """
+import asyncio
 import logging
 import os
 import math
+import sys
+from pathlib import Path
 from typing import Optional
 
 import pandas as pd
 
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    import httpx  # optional: fetch all storefront/page RSS URLs concurrently
+except ImportError:
+    httpx = None
+
+try:
+    from social import _http
+except ImportError:  # run as a script from inside appstore/
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    from social import _http
+
 APP_NAME = os.getenv("APPLE_APP_NAME", "Matiks")
 # Matiks Apple App Store ID (https://apps.apple.com/us/app/matiks-math-and-mind-games/id6738620563)
 APP_ID = int(os.getenv("APPLE_APP_ID", "6738620563"))
@@ -56,39 +75,101 @@ def _safe_get(d: dict, path: list[str], default=""):
     return cur if cur is not None else default
 
 
-def fetch_apple_store_reviews_rss(
+RSS_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; MatiksMonitor/1.0)"}
+
+
+# Keep-alive session that retries transient failures (429/5xx, resets) with backoff.
+_SESSION = _http.make_session(RSS_HEADERS, retries=3) if requests is not None else None
+
+
+def _rss_page_count(count: int, page_size: int = 50) -> int:
+    return max(1, int(math.ceil(count / float(page_size))))
+
+
+def _rss_url(country: str, page: int, app_id: int) -> str:
+    return f"https://itunes.apple.com/{country}/rss/customerreviews/page={page}/id={app_id}/sortBy=mostRecent/json"
+
+
+def _fetch_rss_payload(country: str, page: int, app_id: int) -> Optional[dict]:
+    """One RSS page via the shared session; None on a non-200 or non-JSON response."""
+    if _SESSION is None:
+        raise ImportError("requests is required for RSS fetch")
+
+    resp = _SESSION.get(_rss_url(country, page, app_id), timeout=25)
+    if resp.status_code != 200:
+        return None
+    try:
+        return resp.json()
+    except Exception:
+        # Sometimes Apple returns HTML or empty content unexpectedly.
+        return None
+
+
+async def _fetch_rss_payloads_async(keys: list[tuple[str, int]], app_id: int) -> dict[tuple[str, int], Optional[dict]]:
+    async with httpx.AsyncClient(
+        headers=RSS_HEADERS, timeout=25, limits=httpx.Limits(max_connections=20)
+    ) as client:
+
+        async def _one(country: str, page: int) -> Optional[dict]:
+            try:
+                resp = await client.get(_rss_url(country, page, app_id))
+                if resp.status_code != 200:
+                    return None
+                return resp.json()
+            except Exception:
+                return None
+
+        payloads = await asyncio.gather(*(_one(c, p) for c, p in keys))
+    return dict(zip(keys, payloads))
+
+
+def _prefetch_rss_payloads(
+    countries: list[str], *, count: int, app_id: int, page_size: int = 50
+) -> Optional[dict[tuple[str, int], Optional[dict]]]:
+    """
+    Fetch every page of the given storefronts at once over one pooled httpx client.
+
+    Returns None when httpx isn't installed or an event loop can't be started
+    here, in which case callers fetch pages sequentially.
+    """
+    if httpx is None:
+        return None
+    keys = [(c, p) for c in countries for p in range(1, _rss_page_count(count, page_size) + 1)]
+    try:
+        return asyncio.run(_fetch_rss_payloads_async(keys, app_id))
+    except RuntimeError:
+        return None  # already inside a running event loop
+
+
+RSS_COLUMNS = ("rating", "review_text", "date", "version", "author", "review_id", "url", "country")
+
+
+def _collect_rss_rows(
     *,
     country: str,
     count: int,
     app_id: int,
+    seen_ids: set[str],
+    columns: dict[str, list],
     page_size: int = 50,
-) -> Optional[pd.DataFrame]:
+    prefetched: Optional[dict[tuple[str, int], Optional[dict]]] = None,
+) -> int:
     """
-    Fetch reviews via Apple's public RSS JSON feed.
+    Append up to `count` review rows for one storefront from the RSS JSON feed.
 
-    This is often more reliable than third-party scrapers.
-    Includes `im:version` (app version) when present.
+    Rows go column-wise into `columns` (one list per name in RSS_COLUMNS) and
+    the number added is returned. Reviews whose id is already in `seen_ids` are
+    skipped, and new ids are added to it, so a set shared across storefronts
+    de-dupes while collecting. Pages found in `prefetched` are used as is;
+    pages it lacks or failed to fetch are requested through the retrying session.
     """
-    try:
-        import requests
-    except Exception as e:
-        raise ImportError(f"requests is required for RSS fetch: {e}") from e
+    added = 0
 
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; MatiksMonitor/1.0)"}
-    rows: list[dict] = []
-    seen_urls: set[str] = set()
-
-    pages = max(1, int(math.ceil(count / float(page_size))))
-    for page in range(1, pages + 1):
-        url = f"https://itunes.apple.com/{country}/rss/customerreviews/page={page}/id={app_id}/sortBy=mostRecent/json"
-        resp = requests.get(url, headers=headers, timeout=25)
-        if resp.status_code != 200:
-            continue
-
-        try:
-            payload = resp.json()
-        except Exception:
-            # Sometimes Apple returns HTML or empty content unexpectedly.
+    for page in range(1, _rss_page_count(count, page_size) + 1):
+        payload = prefetched.get((country, page)) if prefetched is not None else None
+        if payload is None:
+            payload = _fetch_rss_payload(country, page, app_id)
+        if payload is None:
             continue
 
         entries = _safe_get(payload, ["feed", "entry"], default=[])
@@ -105,7 +186,7 @@ def fetch_apple_store_reviews_rss(
             url_from_feed = str(_safe_get(e, ["link", "attributes", "href"], default="")).strip()
             url = url_from_feed or f"https://itunes.apple.com/{country}/rss/customerreviews/id={app_id}/sortBy=mostRecent/json"
 
-            if review_id and review_id in seen_urls:
+            if review_id and review_id in seen_ids:
                 continue
 
             rating_raw = _safe_get(e, ["im:rating", "label"], default="")
@@ -123,30 +204,46 @@ def fetch_apple_store_reviews_rss(
             # Prefer full review text; fall back to title if content missing.
             review_text = content or title or ""
 
-            rows.append(
-                {
-                    "rating": rating,
-                    "review_text": review_text,
-                    "date": date_val,
-                    "version": version,
-                    "author": author,
-                    "review_id": review_id,
-                    "url": url,
-                    "country": country,
-                }
-            )
+            columns["rating"].append(rating)
+            columns["review_text"].append(review_text)
+            columns["date"].append(date_val)
+            columns["version"].append(version)
+            columns["author"].append(author)
+            columns["review_id"].append(review_id)
+            columns["url"].append(url)
+            columns["country"].append(country)
+            added += 1
             if review_id:
-                seen_urls.add(review_id)
+                seen_ids.add(review_id)
 
-            if len(rows) >= count:
+            if added >= count:
                 break
 
-        if len(rows) >= count:
+        if added >= count:
             break
 
-    if not rows:
+    return added
+
+
+def fetch_apple_store_reviews_rss(
+    *,
+    country: str,
+    count: int,
+    app_id: int,
+    page_size: int = 50,
+) -> Optional[pd.DataFrame]:
+    """
+    Fetch reviews via Apple's public RSS JSON feed.
+
+    This is often more reliable than third-party scrapers.
+    Includes `im:version` (app version) when present.
+    """
+    columns: dict[str, list] = {c: [] for c in RSS_COLUMNS}
+    if not _collect_rss_rows(
+        country=country, count=count, app_id=app_id, seen_ids=set(), columns=columns, page_size=page_size
+    ):
         return None
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame(columns)
     # Ensure required columns exist (assignment requirement)
     for col in REQUIRED_COLUMNS:
         if col not in df.columns:
@@ -161,26 +258,30 @@ def fetch_apple_store_reviews(app_name=None, country=None, count=None, app_id=No
     app_id = app_id if app_id is not None else APP_ID
     countries = [country] if country else COUNTRIES_TO_TRY
 
-    # 1) Try Apple's RSS JSON feed first (usually the most reliable)
-    rss_dfs: list[pd.DataFrame] = []
+    # 1) Try Apple's RSS JSON feed first (usually the most reliable).
+    # Storefronts overlap, so review ids are de-duped across countries while
+    # collecting and the frame is built once at the end.
+    # Only storefronts that will be read are prefetched: all of them in one batch
+    # when collecting across countries, otherwise one at a time until one has reviews.
+    rss_columns: dict[str, list] = {c: [] for c in RSS_COLUMNS}
+    seen_ids: set[str] = set()
+    prefetched = _prefetch_rss_payloads(countries, count=count, app_id=app_id) if all_countries else None
     for c in countries:
         try:
-            df = fetch_apple_store_reviews_rss(country=c, count=count, app_id=app_id)
-            if df is not None and not df.empty:
-                print(f"Fetched {len(df)} reviews from Apple RSS feed (storefront={c})")
-                rss_dfs.append(df)
+            if not all_countries:
+                prefetched = _prefetch_rss_payloads([c], count=count, app_id=app_id)
+            added = _collect_rss_rows(
+                country=c, count=count, app_id=app_id, seen_ids=seen_ids, columns=rss_columns, prefetched=prefetched
+            )
+            if added:
+                print(f"Fetched {added} reviews from Apple RSS feed (storefront={c})")
                 if not all_countries:
                     break
         except Exception:
             continue
 
-    if rss_dfs:
-        out = pd.concat(rss_dfs, ignore_index=True)
-        # De-dupe across countries by review_id (most reliable), else by content fingerprint.
-        if "review_id" in out.columns:
-            out = out.drop_duplicates(subset=["review_id"])
-        else:
-            out = out.drop_duplicates(subset=["author", "date", "review_text", "rating"])
+    if rss_columns["review_id"]:
+        out = pd.DataFrame(rss_columns)
         # Ensure required columns exist (assignment requirement)
         for col in REQUIRED_COLUMNS:
             if col not in out.columns:
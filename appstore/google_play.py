@@ -32,20 +32,26 @@ def fetch_google_play_reviews(package_id=None, count=None):
     result, _ = reviews(app_id, count=count)
     if not result:
         return None
-    rows = []
+    # Build column lists directly instead of one dict per review.
+    ratings, texts, dates, versions, authors, thumbs = [], [], [], [], [], []
     for r in result:
         at_val = r.get("at")
         if hasattr(at_val, "isoformat"):
             at_val = at_val.isoformat()
-        rows.append({
-            "rating": r.get("score"),
-            "review_text": r.get("content") or "",
-            "date": at_val,
-            "version": r.get("reviewCreatedVersion") or r.get("appVersion") or "",
-            "author": r.get("userName") or "",
-            "thumbsUpCount": r.get("thumbsUpCount"),
-        })
-    return pd.DataFrame(rows)
+        ratings.append(r.get("score"))
+        texts.append(r.get("content") or "")
+        dates.append(at_val)
+        versions.append(r.get("reviewCreatedVersion") or r.get("appVersion") or "")
+        authors.append(r.get("userName") or "")
+        thumbs.append(r.get("thumbsUpCount"))
+    return pd.DataFrame({
+        "rating": ratings,
+        "review_text": texts,
+        "date": dates,
+        "version": versions,
+        "author": authors,
+        "thumbsUpCount": thumbs,
+    })
 
 
 def fetch_google_play_reviews_demo():
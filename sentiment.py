@@ -1,18 +1,34 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import os
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
+import numpy as np
 import pandas as pd
 
+try:
+    from textblob import TextBlob
+except ImportError:
+    TextBlob = None
+
+# "textblob" (default) or "transformers" for a batched HuggingFace classifier.
+SENTIMENT_BACKEND = os.getenv("MATIKS_SENTIMENT_BACKEND", "textblob").strip().lower()
+TRANSFORMERS_MODEL = os.getenv("MATIKS_SENTIMENT_MODEL", "distilbert-base-uncased-finetuned-sst-2-english")
+TRANSFORMERS_BATCH_SIZE = int(os.getenv("MATIKS_SENTIMENT_BATCH_SIZE", "64"))
+
 
-@dataclass(frozen=True)
-class SentimentResult:
+class SentimentResult(NamedTuple):
     polarity: float
     subjectivity: float
     label: str  # "positive" | "neutral" | "negative"
 
 
+# Columns that may hold a row's text, in order of preference.
+TEXT_CANDIDATES = ("text", "review_text", "content", "title")
+
+
 def _safe_text(val: object) -> str:
     if val is None:
         return ""
@@ -21,6 +37,59 @@ def _safe_text(val: object) -> str:
     return str(val).strip()
 
 
+# Common Hindi positive words that TextBlob misclassifies
+_HINDI_POSITIVE_WORDS = ('bahut', 'badhiya', 'accha', 'achha', 'dil', 'maza', 'mast', 'kamaal', 'shaandaar', 'zabardast')
+# Only include actual Hindi negative words, not English words
+_HINDI_NEGATIVE_WORDS = ('bura', 'kharab', 'bekar', 'gandi')
+
+# Specific positive contexts that TextBlob misclassifies
+_POSITIVE_CONTEXTS = (
+    'crazy app', 'crazy good', 'crazy awesome',
+    'brain rot away', 'keeps brain rot away', 'prevents brain rot',
+    'crazy how this app', 'crazy how this', 'crazy this app',
+    'finally gained', 'finally got', 'feels so good', 'dopamine rush',
+    'mad dopamine', 'addicted with', 'leaderboard', 'rankings',
+    '1600 rating', '1600+ rating', 'rating!!!!!', 'feels good man',
+    'highly recommend', 'completely changed', 'used to hate', 'now i do',
+    'mental math', '10-minute duels', 'daily practice',
+    'unmatched', 'speed and accuracy', 'addictive', '1-minute duels',
+    'comparing vs', 'vs other math apps', 'focus is unmatched',
+)
+
+# Achievement/excitement patterns
+_ACHIEVEMENT_PATTERNS = (
+    'finally gained', 'finally got', 'finally achieved',
+    'feels so good', 'feels good', 'so good man',
+    'dopamine rush', 'mad dopamine', 'addicted with',
+    'leaderboard', 'rankings', 'rating!!!!!',
+    'grinding daily', 'daily for past', 'months finally',
+    'used to hate', 'now i do', 'completely changed',
+)
+
+# Clearly negative patterns about Matiks
+_NEGATIVE_PATTERNS = (
+    'matiks is terrible', 'matiks is awful', 'matiks is horrible',
+    'matiks keeps crashing', 'matiks is buggy', 'matiks doesnt work',
+    'hate matiks', 'worst math app', 'matiks is useless',
+    'matiks customer service', 'matiks support is', 'matiks never responds',
+)
+
+
+def _any_of(words: tuple[str, ...]) -> re.Pattern:
+    """One compiled alternation; matches plain substrings, like `word in text`."""
+    return re.compile("|".join(map(re.escape, words)))
+
+
+_HINDI_POSITIVE_RX = _any_of(_HINDI_POSITIVE_WORDS)
+_HINDI_NEGATIVE_RX = _any_of(_HINDI_NEGATIVE_WORDS)
+_POSITIVE_CONTEXT_RX = _any_of(_POSITIVE_CONTEXTS)
+_ACHIEVEMENT_RX = _any_of(_ACHIEVEMENT_PATTERNS)
+_NEGATIVE_RX = _any_of(_NEGATIVE_PATTERNS)
+_CRAZY_POSITIVE_RX = _any_of(('app', 'made me', 'how this', 'awesome', 'amazing', 'good'))
+_COMPARING_POSITIVE_RX = _any_of(('unmatched', 'addictive', 'better', 'superior'))
+_ADDICTIVE_POSITIVE_RX = _any_of(('duels', 'game', 'app', 'matiks'))
+
+
 def analyze_text(text: str, *, neutral_threshold: float = 0.05) -> SentimentResult:
     """
     Compute sentiment using TextBlob with improvements for mixed languages.
@@ -29,70 +98,40 @@ def analyze_text(text: str, *, neutral_threshold: float = 0.05) -> SentimentResu
     - subjectivity: [0, 1]
     - label: negative/neutral/positive based on neutral_threshold
     """
-    from textblob import TextBlob
+    if TextBlob is None:
+        raise ImportError("Install: pip install textblob")
 
     text = _safe_text(text)
     if not text:
         return SentimentResult(polarity=0.0, subjectivity=0.0, label="neutral")
 
-    # Common Hindi positive words that TextBlob misclassifies
-    hindi_positive_words = ['bahut', 'badhiya', 'accha', 'achha', 'dil', 'maza', 'mast', 'kamaal', 'shaandaar', 'zabardast']
-    # Only include actual Hindi negative words, not English words
-    hindi_negative_words = ['bura', 'kharab', 'bekar', 'gandi']
-    
     text_lower = text.lower()
     
     # Check for Hindi sentiment words
-    hindi_positive_count = sum(1 for word in hindi_positive_words if word in text_lower)
-    hindi_negative_count = sum(1 for word in hindi_negative_words if word in text_lower)
+    hindi_positive = _HINDI_POSITIVE_RX.search(text_lower) is not None
+    hindi_negative = _HINDI_NEGATIVE_RX.search(text_lower) is not None
     
     # Handle specific positive contexts that TextBlob misclassifies
-    positive_contexts = [
-        'crazy app', 'crazy good', 'crazy awesome',
-        'brain rot away', 'keeps brain rot away', 'prevents brain rot',
-        'crazy how this app', 'crazy how this', 'crazy this app',
-        'finally gained', 'finally got', 'feels so good', 'dopamine rush',
-        'mad dopamine', 'addicted with', 'leaderboard', 'rankings',
-        '1600 rating', '1600+ rating', 'rating!!!!!', 'feels good man',
-        'highly recommend', 'completely changed', 'used to hate', 'now i do',
-        'mental math', '10-minute duels', 'daily practice',
-        'unmatched', 'speed and accuracy', 'addictive', '1-minute duels',
-        'comparing vs', 'vs other math apps', 'focus is unmatched'
-    ]
-    positive_context_count = sum(1 for ctx in positive_contexts if ctx in text_lower)
+    positive_context = _POSITIVE_CONTEXT_RX.search(text_lower) is not None
     
     # Additional check: if "crazy" appears with positive app-related words
-    if 'crazy' in text_lower and any(word in text_lower for word in ['app', 'made me', 'how this', 'awesome', 'amazing', 'good']):
-        positive_context_count += 1
+    if 'crazy' in text_lower and _CRAZY_POSITIVE_RX.search(text_lower):
+        positive_context = True
     
     # Additional check for comparison patterns that favor Matiks
-    if 'comparing' in text_lower and any(word in text_lower for word in ['unmatched', 'addictive', 'better', 'superior']):
-        positive_context_count += 1
+    if 'comparing' in text_lower and _COMPARING_POSITIVE_RX.search(text_lower):
+        positive_context = True
     
     # Additional check for "addictive" in positive context
-    if 'addictive' in text_lower and any(word in text_lower for word in ['duels', 'game', 'app', 'matiks']):
-        positive_context_count += 1
+    if 'addictive' in text_lower and _ADDICTIVE_POSITIVE_RX.search(text_lower):
+        positive_context = True
     
     # Additional check for achievement/excitement patterns
-    achievement_patterns = [
-        'finally gained', 'finally got', 'finally achieved',
-        'feels so good', 'feels good', 'so good man',
-        'dopamine rush', 'mad dopamine', 'addicted with',
-        'leaderboard', 'rankings', 'rating!!!!!',
-        'grinding daily', 'daily for past', 'months finally',
-        'used to hate', 'now i do', 'completely changed'
-    ]
-    if any(pattern in text_lower for pattern in achievement_patterns):
-        positive_context_count += 1
+    if _ACHIEVEMENT_RX.search(text_lower):
+        positive_context = True
     
     # Check for clearly negative patterns about Matiks
-    negative_patterns = [
-        'matiks is terrible', 'matiks is awful', 'matiks is horrible',
-        'matiks keeps crashing', 'matiks is buggy', 'matiks doesnt work',
-        'hate matiks', 'worst math app', 'matiks is useless',
-        'matiks customer service', 'matiks support is', 'matiks never responds'
-    ]
-    negative_context_count = sum(1 for pattern in negative_patterns if pattern in text_lower)
+    negative_context = _NEGATIVE_RX.search(text_lower) is not None
     
     # Get TextBlob sentiment
     blob = TextBlob(text)
@@ -100,17 +139,17 @@ def analyze_text(text: str, *, neutral_threshold: float = 0.05) -> SentimentResu
     subjectivity = float(blob.sentiment.subjectivity or 0.0)
     
     # Adjust polarity based on Hindi words
-    if hindi_positive_count > 0 and hindi_negative_count == 0:
+    if hindi_positive and not hindi_negative:
         polarity = max(polarity + 0.3, 0.2)  # Boost positive sentiment
-    elif hindi_negative_count > 0 and hindi_positive_count == 0:
+    elif hindi_negative and not hindi_positive:
         polarity = min(polarity - 0.3, -0.2)  # Boost negative sentiment
     
     # Adjust polarity for positive contexts
-    if positive_context_count > 0:
+    if positive_context:
         polarity = max(polarity + 0.5, 0.3)  # Strong boost for positive contexts
     
     # Adjust polarity for negative contexts
-    if negative_context_count > 0:
+    if negative_context:
         polarity = min(polarity - 0.4, -0.3)  # Strong boost for negative contexts
 
     if polarity >= neutral_threshold:
@@ -123,29 +162,114 @@ def analyze_text(text: str, *, neutral_threshold: float = 0.05) -> SentimentResu
     return SentimentResult(polarity=polarity, subjectivity=subjectivity, label=label)
 
 
+@lru_cache(maxsize=1)
+def _transformers_pipeline():
+    """
+    Build the classifier once, on first use.
+
+    Exports the model to ONNX Runtime when `optimum` is installed (faster on CPU),
+    otherwise runs it through plain transformers.
+    """
+    try:
+        from transformers import AutoTokenizer, pipeline
+    except ImportError as e:
+        raise ImportError("Install: pip install transformers torch") from e
+
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+    except ImportError:
+        return pipeline("sentiment-analysis", model=TRANSFORMERS_MODEL, device=-1)
+
+    model = ORTModelForSequenceClassification.from_pretrained(TRANSFORMERS_MODEL, export=True)
+    tokenizer = AutoTokenizer.from_pretrained(TRANSFORMERS_MODEL)
+    return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer, device=-1)
+
+
+def _analyze_batch_transformers(
+    texts: list[str], *, neutral_threshold: float
+) -> list[SentimentResult]:
+    """
+    Score all texts in mini-batches with the transformers classifier.
+
+    polarity is the class score signed by the predicted label; the model gives
+    no subjectivity, so it is NaN. Empty texts stay neutral without a model call.
+    """
+    out = [SentimentResult(polarity=0.0, subjectivity=0.0, label="neutral")] * len(texts)
+    todo = [i for i, t in enumerate(texts) if t]
+    if not todo:
+        return out
+
+    pipe = _transformers_pipeline()
+    preds = pipe([texts[i] for i in todo], batch_size=TRANSFORMERS_BATCH_SIZE, truncation=True, max_length=256)
+    for i, pred in zip(todo, preds):
+        label = str(pred["label"]).lower()
+        score = float(pred["score"])
+        if label.startswith("pos"):
+            polarity = score
+        elif label.startswith("neg"):
+            polarity = -score
+        else:
+            polarity = 0.0
+        if polarity >= neutral_threshold:
+            label = "positive"
+        elif polarity <= -neutral_threshold:
+            label = "negative"
+        else:
+            label = "neutral"
+        out[i] = SentimentResult(polarity=polarity, subjectivity=float("nan"), label=label)
+    return out
+
+
 def add_sentiment_columns(
     df: pd.DataFrame,
     *,
     text_col: str,
     out_prefix: str = "sentiment",
     neutral_threshold: float = 0.05,
+    rating_col: Optional[str] = "rating",
 ) -> pd.DataFrame:
     """
     Adds:
     - {out_prefix}_polarity
     - {out_prefix}_subjectivity
     - {out_prefix}_label
+
+    Rows with a 1-5 star `rating_col` (app store reviews) take their sentiment
+    from the rating: >=4 positive, <=2 negative, 3 neutral, polarity (r - 3) / 2
+    and no subjectivity. Only the remaining rows go through text analysis.
     """
     if df is None or df.empty:
         return df
 
     def _row_analyze(val: object) -> SentimentResult:
+        # Already a (polarity, subjectivity, label) tuple; no unpacking needed.
         return analyze_text(_safe_text(val), neutral_threshold=neutral_threshold)
 
-    results = df[text_col].apply(_row_analyze)
-    df[f"{out_prefix}_polarity"] = results.apply(lambda r: r.polarity)
-    df[f"{out_prefix}_subjectivity"] = results.apply(lambda r: r.subjectivity)
-    df[f"{out_prefix}_label"] = results.apply(lambda r: r.label)
+    if rating_col and rating_col in df.columns:
+        # Ratings arrive as numbers or strings ("5", "5.0", ""); anything else is unrated.
+        stars = pd.to_numeric(df[rating_col], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    else:
+        stars = np.full(len(df), np.nan)
+    rated = (stars >= 1) & (stars <= 5)
+
+    polarity = np.where(rated, (stars - 3) / 2, np.nan)
+    subjectivity = np.full(len(df), np.nan)
+    label = np.where(stars >= 4, "positive", np.where(stars <= 2, "negative", "neutral")).astype(object)
+
+    texts = coalesce_text(df, (text_col, *TEXT_CANDIDATES))[~rated]
+    if SENTIMENT_BACKEND == "transformers":
+        rows = _analyze_batch_transformers(
+            [_safe_text(v) for v in texts.tolist()], neutral_threshold=neutral_threshold
+        )
+    else:
+        # One Python pass over the texts, unpacked straight into three columns.
+        rows = texts.map(_row_analyze).tolist()
+    if rows:
+        polarity[~rated], subjectivity[~rated], label[~rated] = map(list, zip(*rows))
+
+    df[f"{out_prefix}_polarity"] = polarity
+    df[f"{out_prefix}_subjectivity"] = subjectivity
+    df[f"{out_prefix}_label"] = label
     return df
 
 
@@ -154,8 +278,25 @@ def choose_text_column(df: pd.DataFrame) -> Optional[str]:
     if df is None or df.empty:
         return None
 
-    for col in ("text", "review_text", "content", "title"):
+    for col in TEXT_CANDIDATES:
         if col in df.columns:
             return col
     return None
 
+
+def coalesce_text(df: pd.DataFrame, columns=TEXT_CANDIDATES) -> pd.Series:
+    """
+    Per row, the first non-empty value among `columns` (those present in `df`).
+
+    Rows from different sources keep their text in different columns; blanks
+    count as missing so a later column can fill them.
+    """
+    cols = [c for c in dict.fromkeys(columns) if c in df.columns]
+    if not cols:
+        return pd.Series("", index=df.index, dtype=object)
+    if len(cols) == 1:
+        return df[cols[0]]
+    frame = df[cols].astype(object)
+    frame = frame.where(frame.notna() & frame.ne(""))
+    return frame.bfill(axis=1).iloc[:, 0]
+
@@ -0,0 +1,40 @@
+"""
+Shared writers for the social collectors' output files.
+
+pyarrow is optional: without it (or for columns Arrow can't type) CSVs are
+written by pandas.
+"""
+from html import escape
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv  # optional: columnar C CSV writer
+except ImportError:
+    pa_csv = None
+
+
+def write_csv(df: pd.DataFrame, path: str) -> None:
+    """Arrow's C CSV writer when pyarrow is installed; pandas' writer for columns Arrow can't type."""
+    if pa_csv is not None:
+        try:
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+            return
+        except (pa.ArrowInvalid, pa.ArrowTypeError):  # e.g. "" mixed with ints in one column
+            pass
+    df.to_csv(path, index=False)
+
+
+def to_html(df: pd.DataFrame) -> str:
+    """Escaped HTML table for the collectors' small __main__ exports, skipping pandas' formatter."""
+
+    def _cell(v) -> str:
+        return "" if v is None or (isinstance(v, float) and v != v) else escape(str(v))
+
+    head = "".join(f"<th>{escape(str(c))}</th>" for c in df.columns)
+    body = "".join(
+        f"<tr>{''.join(f'<td>{_cell(v)}</td>' for v in row)}</tr>"
+        for row in df.itertuples(index=False, name=None)
+    )
+    return f'<table border="1" class="table"><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>'
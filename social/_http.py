@@ -0,0 +1,146 @@
+"""
+Shared HTTP plumbing for the collectors.
+
+`make_session` builds the pooled, retrying `requests` session behind every
+collector's synchronous path.
+
+On the concurrent paths, every coroutine running on the same event loop goes
+through one pooled `aiohttp.ClientSession` (DNS cached, keep-alive per host) and
+one semaphore that caps requests in flight, so Nitter probes, LinkedIn post pages
+and DuckDuckGo searches launched together share connections instead of each
+opening their own.
+
+aiohttp is optional: callers check `AVAILABLE` and fall back to their
+synchronous `requests` paths when it is missing.
+"""
+import asyncio
+from typing import Mapping, Optional
+from types import MappingProxyType
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
+try:
+    import requests_cache  # optional: on-disk response cache for make_session(cache=...)
+except ImportError:
+    requests_cache = None
+
+AVAILABLE = aiohttp is not None
+CACHE_AVAILABLE = requests_cache is not None
+
+MAX_IN_FLIGHT = 64
+HEADERS = MappingProxyType(
+    {
+        "User-Agent": "Mozilla/5.0 (compatible; MatiksMonitor/1.0)",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def make_session(
+    headers: Mapping[str, str],
+    *,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    host_pools: Optional[Mapping[str, int]] = None,
+    cache: Optional[dict] = None,
+):
+    """
+    Keep-alive `requests` session that retries GETs on 429/5xx and connection errors.
+
+    `host_pools` maps a URL prefix to the size of a dedicated connection pool, so
+    traffic to other hosts never evicts its warm connections. `cache` holds
+    `requests_cache.CachedSession` keyword arguments and is ignored when
+    requests-cache isn't installed.
+    """
+    if cache is not None and requests_cache is not None:
+        session = requests_cache.CachedSession(**cache)
+    else:
+        session = requests.Session()
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,  # rate-limited responses say how long to wait
+        raise_on_status=False,  # hand back the last response; callers check the status
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    for prefix, maxsize in (host_pools or {}).items():
+        session.mount(prefix, HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=maxsize))
+    session.headers.update(headers)
+    return session
+
+
+# Session and semaphore belong to the loop they were created on.
+_state = {"loop": None, "session": None, "semaphore": None}
+
+
+def _current():
+    loop = asyncio.get_running_loop()
+    session = _state["session"]
+    if _state["loop"] is not loop or session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=256, limit_per_host=64, ttl_dns_cache=300)
+        _state.update(
+            loop=loop,
+            session=aiohttp.ClientSession(headers=HEADERS, connector=connector),
+            semaphore=asyncio.Semaphore(MAX_IN_FLIGHT),
+        )
+    return _state["session"], _state["semaphore"]
+
+
+async def get_text(url: str, *, params: Optional[dict] = None, timeout: float = 25) -> Optional[str]:
+    """Body of a 200 response; None for any other status or a failed request."""
+    session, semaphore = _current()
+    async with semaphore:
+        try:
+            async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                if resp.status != 200:
+                    return None
+                return await resp.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+
+
+async def close() -> None:
+    session = _state["session"]
+    _state.update(loop=None, session=None, semaphore=None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def run(coro):
+    """
+    `asyncio.run(coro)`, closing the shared session before the loop goes away.
+
+    Raises RuntimeError when called from inside a running event loop; callers use
+    that to fall back to their synchronous path.
+    """
+
+    async def _main():
+        try:
+            return await coro
+        finally:
+            await close()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_main())
+    coro.close()
+    raise RuntimeError("social._http.run() cannot be called from a running event loop")
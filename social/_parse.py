@@ -0,0 +1,61 @@
+"""
+HTML parsing helpers shared by the social scrapers.
+
+Result extraction only needs plain CSS selection, which selectolax's lexbor
+backend does far faster than BeautifulSoup; the helpers below work on either
+tree. Both parsers are optional: callers check `AVAILABLE` (either one) or
+`HAS_BS4` before parsing.
+"""
+from functools import lru_cache
+
+try:
+    from bs4 import BeautifulSoup, FeatureNotFound
+    import soupsieve  # installed with bs4; lets selectors be compiled once
+except ImportError:
+    BeautifulSoup = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+HAS_BS4 = BeautifulSoup is not None
+AVAILABLE = LexborHTMLParser is not None or HAS_BS4
+
+
+def make_soup(markup: str):
+    """Parse with the C-based lxml parser when installed, else the stdlib html.parser."""
+    try:
+        return BeautifulSoup(markup, "lxml")
+    except FeatureNotFound:
+        return BeautifulSoup(markup, "html.parser")
+
+
+def parse_html(markup: str):
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(markup)
+    return make_soup(markup)
+
+
+@lru_cache(maxsize=None)
+def _compiled(selector: str):
+    return soupsieve.compile(selector)
+
+
+def css(node, selector: str):
+    return node.css(selector) if LexborHTMLParser is not None else _compiled(selector).select(node)
+
+
+def css_first(node, selector: str):
+    return node.css_first(selector) if LexborHTMLParser is not None else _compiled(selector).select_one(node)
+
+
+def text(node, separator: str = "") -> str:
+    if LexborHTMLParser is not None:
+        return node.text(separator=separator, strip=True)
+    return node.get_text(separator, strip=True)
+
+
+def attr(node, name: str) -> str:
+    attrs = node.attributes if LexborHTMLParser is not None else node
+    return attrs.get(name) or ""
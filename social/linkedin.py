@@ -11,9 +11,226 @@ Why fallback-based approach:
   LinkedIn pages mentioning the query; engagement/timestamps are often unavailable
   without authenticated access, so we leave those blank when missing.
 """
+import asyncio
+import json
 import pandas as pd
 import os
+import re
+from contextlib import nullcontext
+from html import unescape
 from typing import Optional, List, Dict
+from types import MappingProxyType
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    import orjson  # optional: faster parsing of the ld+json payloads
+except ImportError:
+    orjson = None
+
+try:
+    from lxml import etree, html as lhtml  # optional: pull ld+json out without building a soup
+except ImportError:
+    lhtml = None
+
+try:
+    from social import _export, _http, _parse
+except ImportError:  # run as a script from inside social/
+    import _export
+    import _http
+    import _parse
+
+HEADERS = MappingProxyType(
+    {
+        "User-Agent": "Mozilla/5.0 (compatible; MatiksMonitor/1.0)",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Connection": "keep-alive",
+    }
+)
+
+# Connections kept open to www.linkedin.com, which serves the company page and every post.
+LINKEDIN_POOL_MAXSIZE = 32
+
+# SQLite file used by requests-cache (when installed) and how long a response is reused.
+HTTP_CACHE_PATH = "cache/http"
+HTTP_CACHE_EXPIRE_S = int(os.getenv("MATIKS_HTTP_CACHE_TTL", "3600"))
+
+
+# Keep-alive session, so the company page, post pages and searches reuse connections.
+# www.linkedin.com gets its own pool, so DuckDuckGo traffic never evicts its warm
+# connections; responses are cached on disk when requests-cache is installed.
+_SESSION = (
+    _http.make_session(
+        HEADERS,
+        retries=4,
+        pool_connections=16,
+        pool_maxsize=32,
+        host_pools={"https://www.linkedin.com": LINKEDIN_POOL_MAXSIZE},
+        cache=dict(
+            cache_name=HTTP_CACHE_PATH,
+            expire_after=HTTP_CACHE_EXPIRE_S,
+            allowable_codes=(200,),
+            allowable_methods=("GET",),
+        ),
+    )
+    if requests is not None
+    else None
+)
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _ld_json_blocks(markup: str) -> List[str]:
+    """Text of every `<script type="application/ld+json">` in the page, in document order."""
+    if lhtml is not None:
+        try:
+            doc = lhtml.fromstring(markup)
+        except Exception:  # empty or unparseable document
+            return []
+        # Plain str copies: orjson rejects lxml's str subclass, which also pins the tree.
+        return [str(t) for t in doc.xpath('//script[@type="application/ld+json"]/text()')]
+    soup = _parse.make_soup(markup)
+    return [s.string for s in soup.find_all("script", attrs={"type": "application/ld+json"}) if s.string]
+
+
+def _load_ld_json(markup: str, accept) -> Optional[dict]:
+    """First ld+json object in the page for which `accept(obj)` holds."""
+    for block in _ld_json_blocks(markup):
+        try:
+            payload = _json_loads(block)
+        except Exception:
+            continue
+        if isinstance(payload, dict) and accept(payload):
+            return payload
+    return None
+
+
+# (output name, ld+json keys tried in order). Post pages usually carry the body in
+# 'articleBody'; the company page's @graph entries in 'text'.
+_POST_PAGE_FIELDS = (("content", ("articleBody", "text")), ("timestamp", ("datePublished",)))
+_GRAPH_POST_FIELDS = (("content", ("text", "articleBody")), ("url", ("url",)), ("timestamp", ("datePublished",)))
+
+
+def _text_fields(d: dict, fields) -> Dict[str, str]:
+    """The first non-empty value of each field's keys, stripped ("" when none is set)."""
+    get = d.get
+    out: Dict[str, str] = {}
+    for name, keys in fields:
+        val = None
+        for key in keys:
+            val = get(key)
+            if val:
+                break
+        out[name] = (val or "").strip()
+    return out
+
+
+def _stream_ld_json(resp, accept) -> Optional[dict]:
+    """
+    `_load_ld_json` over a streamed response: the body is fed to lxml's pull parser
+    in chunks and reading stops as soon as an accepted ld+json block has closed.
+    """
+    if lhtml is None:
+        return _load_ld_json(resp.text, accept)
+
+    parser = etree.HTMLPullParser(events=("end",), tag="script", encoding=resp.encoding or "utf-8")
+
+    def _accepted(events) -> Optional[dict]:
+        for _, el in events:
+            if el.get("type") != "application/ld+json" or not el.text:
+                continue
+            try:
+                payload = _json_loads(el.text)
+            except Exception:
+                continue
+            if isinstance(payload, dict) and accept(payload):
+                return payload
+        return None
+
+    for chunk in resp.iter_content(chunk_size=16384):
+        parser.feed(chunk)
+        payload = _accepted(parser.read_events())
+        if payload is not None:
+            return payload
+    parser.close()
+    return _accepted(parser.read_events())
+
+
+def _parse_post_enrichment(html: str) -> Dict[str, object]:
+    """Content, timestamp and engagement from a public post page's ld+json; {} when absent."""
+    try:
+        d2 = _load_ld_json(html, lambda d: True)
+        if d2 is None:
+            return {}
+        out: Dict[str, object] = _text_fields(d2, _POST_PAGE_FIELDS)
+
+        likes = ""
+        comments = ""
+        stats = d2.get("interactionStatistic")
+        if isinstance(stats, list):
+            for s in stats:
+                if not isinstance(s, dict):
+                    continue
+                it = str(s.get("interactionType") or "")
+                cnt = s.get("userInteractionCount")
+                if cnt is None:
+                    continue
+                if "LikeAction" in it:
+                    likes = cnt
+                if "CommentAction" in it:
+                    comments = cnt
+
+        # Fallback: sometimes commentCount exists.
+        if comments == "" and d2.get("commentCount") is not None:
+            comments = d2.get("commentCount")
+
+        out["engagement_likes"] = likes
+        out["engagement_comments"] = comments
+        return out
+    except Exception:
+        return {}
+
+
+def _enrich_from_post_url(post_url: str) -> Dict[str, object]:
+    try:
+        r2 = _SESSION.get(post_url, timeout=25)
+        if r2.status_code != 200:
+            return {}
+    except Exception:
+        return {}
+    return _parse_post_enrichment(r2.text)
+
+
+async def _enrich_post_urls_async(post_urls: List[str]) -> List[Dict[str, object]]:
+    loop = asyncio.get_running_loop()
+
+    async def _fetch_one(post_url: str) -> Dict[str, object]:
+        markup = await _http.get_text(post_url) if post_url else None
+        if not markup:
+            return {}
+        # Parsing is CPU-bound; keep it off the event loop.
+        return await loop.run_in_executor(None, _parse_post_enrichment, markup)
+
+    return await asyncio.gather(*(_fetch_one(u) for u in post_urls))
+
+
+def _enrich_post_urls(post_urls: List[str]) -> List[Dict[str, object]]:
+    """
+    Enrichment for each post URL ({} where unavailable), in order.
+
+    With aiohttp installed the pages are fetched concurrently; otherwise (or from
+    inside a running event loop) they are fetched one after another.
+    """
+    if _http.AVAILABLE:
+        try:
+            return _http.run(_enrich_post_urls_async(post_urls))
+        except RuntimeError:
+            pass  # already inside a running event loop
+    return [_enrich_from_post_url(u) if u else {} for u in post_urls]
 
 
 def fetch_linkedin_mentions_api(query="Matiks", limit=50):
@@ -21,6 +238,67 @@ def fetch_linkedin_mentions_api(query="Matiks", limit=50):
     raise NotImplementedError("LinkedIn API requires partner access. Using demo data.")
 
 
+def _require_company_deps() -> None:
+    if requests is None:
+        raise ImportError("Missing dependency for company page fetch: requests is not installed")
+    if lhtml is None and not _parse.HAS_BS4:
+        raise ImportError("Missing dependency for company page fetch: neither lxml nor bs4 is installed")
+
+
+def _has_graph(payload: dict) -> bool:
+    return isinstance(payload.get("@graph"), list) and bool(payload["@graph"])
+
+
+def _company_posts(payload: Optional[dict], limit: int):
+    """(organisation name, text fields of up to `limit` posts) from the page's @graph; None without posts."""
+    if payload is None:
+        return None
+    graph = payload["@graph"]
+
+    org = next((n for n in graph if isinstance(n, dict) and n.get("@type") == "Organization"), None)
+    org_name = (org or {}).get("name") or "Matiks"
+
+    posts = [n for n in graph if isinstance(n, dict) and n.get("@type") == "DiscussionForumPosting"]
+    if not posts:
+        return None
+    return org_name, [_text_fields(p, _GRAPH_POST_FIELDS) for p in posts[: max(1, limit)]]
+
+
+def _company_posts_frame(
+    org_name: str,
+    post_fields: List[Dict[str, str]],
+    enrichments: List[Dict[str, object]],
+    *,
+    company_slug: str,
+    url: str,
+) -> pd.DataFrame:
+    contents: List[str] = []
+    timestamps: List[str] = []
+    likes: List[object] = []
+    comments: List[object] = []
+    urls: List[str] = []
+    for fields, enriched in zip(post_fields, enrichments):
+        contents.append(enriched.get("content") or fields["content"])
+        timestamps.append(enriched.get("timestamp") or fields["timestamp"])
+        likes.append(enriched.get("engagement_likes", ""))
+        comments.append(enriched.get("engagement_comments", ""))
+        urls.append(fields["url"] or url)
+
+    return pd.DataFrame(
+        {
+            "content": contents,
+            "author": org_name,
+            "timestamp": timestamps,
+            "engagement_likes": likes,
+            "engagement_comments": comments,
+            "url": urls,
+            "company_slug": company_slug,
+            "source": "linkedin_ldjson_company",
+        },
+        copy=False,
+    )
+
+
 def fetch_linkedin_company_posts_public(company_slug: str = "matiks", limit: int = 5) -> Optional[pd.DataFrame]:
     """
     Free + relatively stable option: fetch the public LinkedIn company page and extract
@@ -32,108 +310,136 @@ def fetch_linkedin_company_posts_public(company_slug: str = "matiks", limit: int
     - We can enrich engagement metrics by fetching each public post URL and reading
       its `interactionStatistic` from ld+json (when present).
     """
-    try:
-        import json
-        import requests
-        from bs4 import BeautifulSoup
-    except Exception as e:
-        raise ImportError(f"Missing dependency for company page fetch: {e}") from e
+    _require_company_deps()
 
     url = f"https://www.linkedin.com/company/{company_slug}/"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; MatiksMonitor/1.0)",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
-
-    resp = requests.get(url, headers=headers, timeout=25)
-    if resp.status_code != 200:
+    # Streamed: the ld+json block sits in <head>, so most of the page is never read.
+    # A CachedSession would read the whole body to store it, so bypass the cache here.
+    no_cache = _SESSION.cache_disabled() if _http.CACHE_AVAILABLE else nullcontext()
+    with no_cache, _SESSION.get(url, timeout=25, stream=True) as resp:
+        if resp.status_code != 200:
+            return None
+        payload = _stream_ld_json(resp, _has_graph)
+
+    found = _company_posts(payload, limit)
+    if found is None:
         return None
+    org_name, post_fields = found
+    enrichments = _enrich_post_urls([f["url"] for f in post_fields])
+    return _company_posts_frame(org_name, post_fields, enrichments, company_slug=company_slug, url=url)
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    script = soup.find("script", attrs={"type": "application/ld+json"})
-    if not script or not script.string:
-        return None
 
-    try:
-        payload = json.loads(script.string)
-    except Exception:
+async def fetch_linkedin_company_posts_public_async(
+    company_slug: str = "matiks", limit: int = 5
+) -> Optional[pd.DataFrame]:
+    """`fetch_linkedin_company_posts_public` for callers already on an event loop (needs aiohttp)."""
+    _require_company_deps()
+
+    url = f"https://www.linkedin.com/company/{company_slug}/"
+    markup = await _http.get_text(url)
+    if markup is None:
         return None
+    payload = await asyncio.get_running_loop().run_in_executor(None, _load_ld_json, markup, _has_graph)
 
-    graph = payload.get("@graph", [])
-    if not isinstance(graph, list) or not graph:
+    found = _company_posts(payload, limit)
+    if found is None:
         return None
+    org_name, post_fields = found
+    enrichments = await _enrich_post_urls_async([f["url"] for f in post_fields])
+    return _company_posts_frame(org_name, post_fields, enrichments, company_slug=company_slug, url=url)
 
-    org = next((n for n in graph if isinstance(n, dict) and n.get("@type") == "Organization"), None)
-    org_name = (org or {}).get("name") or "Matiks"
 
-    posts = [n for n in graph if isinstance(n, dict) and n.get("@type") == "DiscussionForumPosting"]
-    if not posts:
-        return None
+# DuckDuckGo's HTML results are regular enough to pull out with regexes, which is much
+# faster than building any DOM. MATIKS_DDG_PARSER=dom switches back to CSS selection.
+DDG_PARSER = os.getenv("MATIKS_DDG_PARSER", "regex").strip().lower()
 
-    rows: List[Dict[str, object]] = []
-    for p in posts[: max(1, limit)]:
-        def _enrich_from_post_url(post_url_in: str) -> Dict[str, object]:
-            try:
-                r2 = requests.get(post_url_in, headers=headers, timeout=25)
-                if r2.status_code != 200:
-                    return {}
-                soup2 = BeautifulSoup(r2.text, "html.parser")
-                s2 = soup2.find("script", attrs={"type": "application/ld+json"})
-                if not s2 or not s2.string:
-                    return {}
-                d2 = json.loads(s2.string)
-                # Some post pages use 'articleBody' for the content.
-                content2 = (d2.get("articleBody") or d2.get("text") or "").strip()
-                ts2 = (d2.get("datePublished") or "").strip()
-
-                likes = ""
-                comments = ""
-                stats = d2.get("interactionStatistic")
-                if isinstance(stats, list):
-                    for s in stats:
-                        if not isinstance(s, dict):
-                            continue
-                        it = str(s.get("interactionType") or "")
-                        cnt = s.get("userInteractionCount")
-                        if cnt is None:
-                            continue
-                        if "LikeAction" in it:
-                            likes = cnt
-                        if "CommentAction" in it:
-                            comments = cnt
-
-                # Fallback: sometimes commentCount exists.
-                if comments == "" and d2.get("commentCount") is not None:
-                    comments = d2.get("commentCount")
-
-                return {
-                    "content": content2,
-                    "timestamp": ts2,
-                    "engagement_likes": likes,
-                    "engagement_comments": comments,
-                }
-            except Exception:
-                return {}
-
-        text = (p.get("text") or p.get("articleBody") or "").strip()
-        post_url = (p.get("url") or "").strip()
-        date_published = (p.get("datePublished") or "").strip()
-        enriched: Dict[str, object] = _enrich_from_post_url(post_url) if post_url else {}
-
-        rows.append(
-            {
-                "content": enriched.get("content") or text,
-                "author": org_name,
-                "timestamp": enriched.get("timestamp") or date_published,
-                "engagement_likes": enriched.get("engagement_likes", ""),
-                "engagement_comments": enriched.get("engagement_comments", ""),
-                "url": post_url or url,
-                "company_slug": company_slug,
-                "source": "linkedin_ldjson_company",
-            }
+_DDG_LINK_RE = re.compile(r'(<a\s[^>]*class="[^"]*\bresult__a\b[^"]*"[^>]*>)(.*?)</a>', re.S)
+_DDG_SNIPPET_RE = re.compile(r'<(a|div|td)\s[^>]*class="[^"]*\bresult__snippet\b[^"]*"[^>]*>(.*?)</\1>', re.S)
+_HREF_RE = re.compile(r'\bhref="([^"]*)"')
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _html_text(fragment: str) -> str:
+    return " ".join(unescape(_TAG_RE.sub(" ", fragment)).split())
+
+
+def _ddg_results_regex(markup: str):
+    """(href, title, snippet) per result; a snippet is only looked for up to the next result link."""
+    links = list(_DDG_LINK_RE.finditer(markup))
+    for i, m in enumerate(links):
+        href_m = _HREF_RE.search(m.group(1))
+        end = links[i + 1].start() if i + 1 < len(links) else len(markup)
+        snippet_m = _DDG_SNIPPET_RE.search(markup, m.end(), end)
+        yield (
+            unescape(href_m.group(1)).strip() if href_m else "",
+            _html_text(m.group(2)),
+            _html_text(snippet_m.group(2)) if snippet_m else "",
         )
 
-    return pd.DataFrame(rows)
+
+def _ddg_results_dom(markup: str):
+    """(href, title, snippet) per result, via CSS selection on a parsed tree."""
+    tree = _parse.parse_html(markup)
+    # DuckDuckGo HTML layout: results under .result
+    for r in _parse.css(tree, ".result"):
+        a = _parse.css_first(r, "a.result__a")
+        if not a:
+            continue
+        snippet_el = _parse.css_first(r, ".result__snippet")
+        yield _parse.attr(a, "href").strip(), _parse.text(a, " "), _parse.text(snippet_el, " ") if snippet_el else ""
+
+
+DDG_URL = "https://duckduckgo.com/html/"
+
+
+def _require_search_deps() -> bool:
+    """Checks the search dependencies; True when results are to be read from a DOM."""
+    if requests is None:
+        raise ImportError("Missing dependency for public search: requests is not installed")
+    use_dom = DDG_PARSER == "dom"
+    if use_dom and not _parse.AVAILABLE:
+        raise ImportError("Missing dependency for public search: neither selectolax nor bs4 is installed")
+    return use_dom
+
+
+def _search_frame(markup: str, query: str, limit: int, *, use_dom: bool) -> Optional[pd.DataFrame]:
+    contents: List[str] = []
+    urls: List[str] = []
+    titles: List[str] = []
+    snippets: List[str] = []
+
+    results = _ddg_results_dom(markup) if use_dom else _ddg_results_regex(markup)
+    for href, title, snippet in results:
+        # Keep only LinkedIn URLs
+        if "linkedin.com" not in href.lower():
+            continue
+
+        contents.append((snippet or title or "").strip())
+        urls.append(href)
+        titles.append(title)
+        snippets.append(snippet)
+
+        if len(urls) >= limit:
+            break
+
+    if not urls:
+        return None
+    # Minimal normalization — we can't reliably get author/timestamp/engagement without auth.
+    return pd.DataFrame(
+        {
+            "content": contents,
+            "author": "",
+            "timestamp": "",
+            "engagement_likes": "",
+            "engagement_comments": "",
+            "url": urls,
+            "title": titles,
+            "snippet": snippets,
+            "query": query,
+            "source": "duckduckgo_html",
+        },
+        copy=False,
+    )
 
 
 def fetch_linkedin_mentions_public_search(query: str = "Matiks", limit: int = 20) -> Optional[pd.DataFrame]:
@@ -145,63 +451,22 @@ def fetch_linkedin_mentions_public_search(query: str = "Matiks", limit: int = 20
     - content, author, timestamp, engagement_likes, engagement_comments, url
     (author/timestamp/engagement may be blank if not available in public snippets)
     """
-    try:
-        import requests
-        from bs4 import BeautifulSoup
-    except Exception as e:
-        raise ImportError(f"Missing dependency for public search: {e}") from e
-
-    q = f"site:linkedin.com {query}"
-    url = "https://duckduckgo.com/html/"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; MatiksMonitor/1.0)",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
+    use_dom = _require_search_deps()
 
-    resp = requests.get(url, params={"q": q}, headers=headers, timeout=25)
+    resp = _SESSION.get(DDG_URL, params={"q": f"site:linkedin.com {query}"}, timeout=25)
     if resp.status_code != 200:
         return None
+    return _search_frame(resp.text, query, limit, use_dom=use_dom)
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    results: List[Dict[str, object]] = []
-
-    # DuckDuckGo HTML layout: results under .result
-    for r in soup.select(".result"):
-        a = r.select_one("a.result__a")
-        if not a:
-            continue
-        href = (a.get("href") or "").strip()
-        title = a.get_text(" ", strip=True)
-
-        snippet_el = r.select_one(".result__snippet")
-        snippet = snippet_el.get_text(" ", strip=True) if snippet_el else ""
 
-        # Keep only LinkedIn URLs
-        if "linkedin.com" not in href.lower():
-            continue
-
-        # Minimal normalization — we can't reliably get author/timestamp/engagement without auth.
-        results.append(
-            {
-                "content": (snippet or title or "").strip(),
-                "author": "",
-                "timestamp": "",
-                "engagement_likes": "",
-                "engagement_comments": "",
-                "url": href,
-                "title": title,
-                "snippet": snippet,
-                "query": query,
-                "source": "duckduckgo_html",
-            }
-        )
-
-        if len(results) >= limit:
-            break
+async def fetch_linkedin_mentions_public_search_async(query: str = "Matiks", limit: int = 20) -> Optional[pd.DataFrame]:
+    """`fetch_linkedin_mentions_public_search` for callers already on an event loop (needs aiohttp)."""
+    use_dom = _require_search_deps()
 
-    if not results:
+    markup = await _http.get_text(DDG_URL, params={"q": f"site:linkedin.com {query}"})
+    if markup is None:
         return None
-    return pd.DataFrame(results)
+    return _search_frame(markup, query, limit, use_dom=use_dom)
 
 
 def fetch_linkedin_mentions_demo():
@@ -272,9 +537,9 @@ if __name__ == "__main__":
 
     df["platform"] = "LinkedIn"
     os.makedirs("output", exist_ok=True)
-    df.to_csv("output/linkedin_mentions.csv", index=False)
+    _export.write_csv(df, "output/linkedin_mentions.csv")
     with open("output/linkedin_mentions.html", "w", encoding="utf-8") as f:
         f.write("<meta charset='utf-8'><h1>LinkedIn mentions – Matiks</h1>")
-        f.write(df.to_html(index=False, classes="table", border=1))
+        f.write(_export.to_html(df))
     print(f"Collected {len(df)} LinkedIn mentions (content, author, timestamps, engagement).")
     print("Saved to output/linkedin_mentions.csv and output/linkedin_mentions.html")
@@ -1,27 +1,45 @@
 import requests
 import pandas as pd
 import os
+from types import MappingProxyType
+
+try:
+    import orjson  # optional: faster parsing of the search payload
+except ImportError:
+    orjson = None
+
+try:
+    from social import _export, _http
+except ImportError:  # run as a script from inside social/
+    import _export
+    import _http
+
+HEADERS = MappingProxyType({"User-Agent": "brand-monitor-bot/0.1 by intern"})
+
+POST_COLUMNS = ("title", "content", "author", "created_utc", "score", "url", "num_comments")
+
+
+# Keep-alive session so repeated searches reuse the connection to reddit.com.
+_SESSION = _http.make_session(HEADERS, retries=4, pool_connections=16, pool_maxsize=32)
 
 def fetch_reddit_mentions_json(query="Matiks", limit=10):
     url = f"https://www.reddit.com/search.json"
     params = {"q": query, "limit": limit}
-    headers = {"User-Agent": "brand-monitor-bot/0.1 by intern"}
-    response = requests.get(url, headers=headers, params=params, timeout=10)
+    response = _SESSION.get(url, params=params, timeout=10)
     response.raise_for_status()
-    posts = response.json()["data"]["children"]
-    results = []
+    payload = orjson.loads(response.content) if orjson is not None else response.json()
+    posts = payload["data"]["children"]
+    columns = {c: [] for c in POST_COLUMNS}
     for post in posts:
         data = post["data"]
-        results.append({
-            "title": data["title"],
-            "content": data.get("selftext", ""),
-            "author": data["author"],
-            "created_utc": data["created_utc"],
-            "score": data["score"],
-            "url": f"https://reddit.com{data['permalink']}",
-            "num_comments": data["num_comments"],
-        })
-    return pd.DataFrame(results)
+        columns["title"].append(data["title"])
+        columns["content"].append(data.get("selftext", ""))
+        columns["author"].append(data["author"])
+        columns["created_utc"].append(data["created_utc"])
+        columns["score"].append(data["score"])
+        columns["url"].append(f"https://reddit.com{data['permalink']}")
+        columns["num_comments"].append(data["num_comments"])
+    return pd.DataFrame(columns, copy=False)
 
 def fetch_reddit_mentions_demo():
     # Demo fallback, in case /search.json fails
@@ -37,6 +55,7 @@ def fetch_reddit_mentions_demo():
     ]
     return pd.DataFrame(data)
 
+
 if __name__ == "__main__":
     try:
         df = fetch_reddit_mentions_json()
@@ -46,11 +65,11 @@ if __name__ == "__main__":
         df = fetch_reddit_mentions_demo()
     print(df.head())
     os.makedirs("output", exist_ok=True)
-    df.to_csv("output/reddit_mentions.csv", index=False)
+    _export.write_csv(df, "output/reddit_mentions.csv")
     html_path = "output/reddit_mentions.html"
     with open(html_path, "w", encoding="utf-8") as f:
         f.write("<meta charset='utf-8'><h1>Reddit mentions – Matiks</h1>")
-        f.write(df.to_html(index=False, classes="table", border=1))
+        f.write(_export.to_html(df))
 
     print("Saved Reddit results to output/reddit_mentions.csv")
     print("Open output/reddit_mentions.html in a browser to view as a table.")
\ No newline at end of file
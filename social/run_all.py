@@ -0,0 +1,61 @@
+"""
+Run the network-bound social collectors together on one event loop.
+
+Nitter search, the LinkedIn company page (plus its post pages) and the DuckDuckGo
+LinkedIn search are independent, so they are gathered concurrently and share the
+pooled aiohttp session from `social._http`. Requires aiohttp.
+
+Usage (from the repository root):
+    python -m social.run_all
+"""
+import asyncio
+import os
+from typing import Dict, Optional
+
+import pandas as pd
+
+from social import _export, _http
+from social.linkedin import (
+    fetch_linkedin_company_posts_public_async,
+    fetch_linkedin_mentions_public_search_async,
+)
+from social.twitter import fetch_twitter_mentions_nitter_async
+
+
+async def collect(
+    query: str = "Matiks", limit: int = 20, *, company_slug: str = "matiks"
+) -> Dict[str, Optional[pd.DataFrame]]:
+    """Each collector's DataFrame keyed by output name; None where it failed or found nothing."""
+    jobs = {
+        "twitter_mentions": fetch_twitter_mentions_nitter_async(query, limit),
+        "linkedin_company_posts": fetch_linkedin_company_posts_public_async(company_slug, limit=5),
+        "linkedin_mentions": fetch_linkedin_mentions_public_search_async(query, limit),
+    }
+    results = await asyncio.gather(*jobs.values(), return_exceptions=True)
+
+    frames: Dict[str, Optional[pd.DataFrame]] = {}
+    for name, result in zip(jobs, results):
+        if isinstance(result, BaseException):
+            print(f"{name}: failed ({result})")
+            result = None
+        frames[name] = result
+    return frames
+
+
+def main(query: str = "Matiks", limit: int = 20, output_dir: str = "output") -> None:
+    if not _http.AVAILABLE:
+        raise SystemExit("aiohttp is required for the concurrent run (pip install aiohttp)")
+
+    frames = _http.run(collect(query, limit))
+    os.makedirs(output_dir, exist_ok=True)
+    for name, df in frames.items():
+        if df is None or df.empty:
+            print(f"{name}: no results")
+            continue
+        path = os.path.join(output_dir, f"{name}.csv")
+        _export.write_csv(df, path)
+        print(f"{name}: {len(df)} rows -> {path}")
+
+
+if __name__ == "__main__":
+    main()
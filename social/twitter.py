@@ -3,14 +3,75 @@ Twitter/X mentions collector for Matiks.
 API-ready: will use official API or snscrape when available.
 Fallback: demo data (scraping can be blocked/unstable).
 """
+import asyncio
 import pandas as pd
 import os
+from datetime import datetime, timezone
+from itertools import islice
+from operator import attrgetter
 from typing import Optional, List, Dict
+from types import MappingProxyType
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    import snscrape.modules.twitter as sntwitter
+    _SNSCRAPE_ERROR = None
+except Exception as e:  # snscrape can fail with more than ImportError on newer Pythons
+    sntwitter = None
+    _SNSCRAPE_ERROR = e
+
+try:
+    from social import _export, _http, _parse
+except ImportError:  # run as a script from inside social/
+    import _export
+    import _http
+    import _parse
+
+HEADERS = MappingProxyType({"User-Agent": "Mozilla/5.0 (compatible; MatiksMonitor/1.0)"})
+
+
+# Keep-alive session shared by every Nitter request, including instance fallbacks.
+_SESSION = _http.make_session(HEADERS, retries=4, pool_connections=16, pool_maxsize=32) if requests is not None else None
+
+NITTER_INSTANCES = [
+    "https://nitter.net",
+    "https://nitter.poast.org",
+    "https://nitter.privacydev.net",
+]
+
+TWEET_COLUMNS = ("date", "content", "username", "name", "replyCount", "retweetCount", "likeCount", "url")
+
 
 def fetch_twitter_mentions_api(query="Matiks", limit=50):
     """Placeholder for official Twitter API (requires paid access/credits)."""
     raise NotImplementedError("Twitter API requires paid access. Using demo data.")
 
+_SNSCRAPE_FIELDS = attrgetter("user", "date", "replyCount", "retweetCount", "likeCount", "url", "rawContent")
+
+
+def _tweet_fields(tweet) -> tuple:
+    """(user, date, replyCount, retweetCount, likeCount, url, content) of an snscrape tweet."""
+    try:
+        fields = _SNSCRAPE_FIELDS(tweet)
+    except AttributeError:  # older snscrape releases (no rawContent) or partial objects
+        fields = (
+            getattr(tweet, "user", None),
+            getattr(tweet, "date", None),
+            getattr(tweet, "replyCount", None),
+            getattr(tweet, "retweetCount", None),
+            getattr(tweet, "likeCount", None),
+            getattr(tweet, "url", ""),
+            None,
+        )
+    if not fields[-1]:
+        fields = fields[:-1] + (getattr(tweet, "content", ""),)
+    return fields
+
+
 def fetch_twitter_mentions_snscrape(query: str = "Matiks", limit: int = 50) -> pd.DataFrame:
     """
     Best-effort no-key mode using snscrape.
@@ -20,50 +81,131 @@ def fetch_twitter_mentions_snscrape(query: str = "Matiks", limit: int = 50) -> p
     - We keep the same schema as demo: date, content, username, name, replyCount,
       retweetCount, likeCount, url
     """
-    try:
-        import snscrape.modules.twitter as sntwitter
-    except Exception as e:
-        raise ImportError(f"snscrape not available: {e}") from e
+    if sntwitter is None:
+        raise ImportError(f"snscrape not available: {_SNSCRAPE_ERROR}") from _SNSCRAPE_ERROR
 
     # A slightly more targeted query helps reduce noise.
     # (You can tune this later: include @Matiks, "matiks app", etc.)
     q = query
     scraper = sntwitter.TwitterSearchScraper(q)
 
-    rows = []
-    for i, tweet in enumerate(scraper.get_items()):
-        if i >= limit:
-            break
-        user = getattr(tweet, "user", None)
+    columns: Dict[str, list] = {c: [] for c in TWEET_COLUMNS}
+    for tweet in islice(scraper.get_items(), limit):
+        user, date_val, reply_count, retweet_count, like_count, url, content = _tweet_fields(tweet)
         username = getattr(user, "username", "") if user else ""
         name = getattr(user, "displayname", "") if user else ""
-        date_val = getattr(tweet, "date", None)
         if hasattr(date_val, "isoformat"):
             date_val = date_val.isoformat()
 
+        columns["date"].append(date_val)
+        columns["content"].append(content)
+        columns["username"].append(username)
+        columns["name"].append(name)
+        columns["replyCount"].append(reply_count)
+        columns["retweetCount"].append(retweet_count)
+        columns["likeCount"].append(like_count)
+        columns["url"].append(url)
+
+    return pd.DataFrame(columns, copy=False)
+
+def _parse_nitter_search(markup: str, limit: int) -> Dict[str, list]:
+    """Up to `limit` tweets from a Nitter search page, one list per TWEET_COLUMNS name."""
+    columns: Dict[str, list] = {c: [] for c in TWEET_COLUMNS}
+    tree = _parse.parse_html(markup)
+    for item in _parse.css(tree, ".timeline-item"):
+        # Content
+        content_el = _parse.css_first(item, ".tweet-content")
+        content = _parse.text(content_el, " ") if content_el else ""
+        if not content:
+            continue
+
+        # Author
+        username_el = _parse.css_first(item, "a.username")
+        fullname_el = _parse.css_first(item, "a.fullname")
+        username = _parse.text(username_el).lstrip("@") if username_el else ""
+        name = _parse.text(fullname_el) if fullname_el else ""
+
+        # Timestamp + permalink (Nitter links are relative, e.g. /user/status/123#m)
+        date_el = _parse.css_first(item, ".tweet-date a")
+        date_val = _parse_nitter_date(_parse.attr(date_el, "title")) if date_el else ""
+        href = _parse.attr(date_el, "href").split("#")[0] if date_el else ""
+        tweet_url = f"https://twitter.com{href}" if href else ""
+
         # Metrics
-        reply_count = getattr(tweet, "replyCount", None)
-        retweet_count = getattr(tweet, "retweetCount", None)
-        like_count = getattr(tweet, "likeCount", None)
-
-        url = getattr(tweet, "url", "")
-        content = getattr(tweet, "rawContent", None) or getattr(tweet, "content", "")
-
-        rows.append(
-            {
-                "date": date_val,
-                "content": content,
-                "username": username,
-                "name": name,
-                "replyCount": reply_count,
-                "retweetCount": retweet_count,
-                "likeCount": like_count,
-                "url": url,
-            }
-        )
+        stats = {"comment": None, "retweet": None, "heart": None}
+        for stat in _parse.css(item, ".tweet-stat"):
+            for kind in stats:
+                if _parse.css_first(stat, f".icon-{kind}"):
+                    stats[kind] = _parse_count(_parse.text(stat))
+                    break
+
+        columns["date"].append(date_val)
+        columns["content"].append(content)
+        columns["username"].append(username)
+        columns["name"].append(name)
+        columns["replyCount"].append(stats["comment"])
+        columns["retweetCount"].append(stats["retweet"])
+        columns["likeCount"].append(stats["heart"])
+        columns["url"].append(tweet_url)
+        if len(columns["content"]) >= limit:
+            break
+    return columns
+
+
+def _search_nitter_sequential(bases: List[str], query: str, limit: int) -> Optional[Dict[str, list]]:
+    for base in bases:
+        try:
+            url = f"{base.rstrip('/')}/search"
+            # 429s and 5xx are retried on this instance first (honouring Retry-After);
+            # only a connection failure or a still-failing response moves on to the next.
+            r = _SESSION.get(url, params={"f": "tweets", "q": query}, timeout=25)
+            if r.status_code != 200 or not r.text:
+                continue
+            columns = _parse_nitter_search(r.text, limit)
+            if columns["content"]:
+                return columns  # one working instance is enough
+        except Exception:
+            continue
+    return None
+
+
+async def _search_nitter_race(bases: List[str], query: str, limit: int) -> Optional[Dict[str, list]]:
+    """Query every instance at once; the first to return tweets wins and the rest are cancelled."""
+    loop = asyncio.get_running_loop()
+
+    async def _probe(base: str) -> Optional[Dict[str, list]]:
+        markup = await _http.get_text(f"{base.rstrip('/')}/search", params={"f": "tweets", "q": query}, timeout=8)
+        if not markup:
+            return None
+        columns = await loop.run_in_executor(None, _parse_nitter_search, markup, limit)
+        return columns if columns["content"] else None
+
+    pending = {asyncio.ensure_future(_probe(b)) for b in bases}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None and task.result() is not None:
+                    return task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return None
+
+
+def _require_nitter_deps() -> None:
+    if requests is None:
+        raise ImportError("Missing dependency for nitter scrape: requests is not installed")
+    if not _parse.AVAILABLE:
+        raise ImportError("Missing dependency for nitter scrape: neither selectolax nor bs4 is installed")
+
+
+def _tweet_frame(columns: Optional[Dict[str, list]]) -> pd.DataFrame:
+    if columns is None:
+        columns = {c: [] for c in TWEET_COLUMNS}
+    return pd.DataFrame(columns, copy=False)
 
-    df = pd.DataFrame(rows)
-    return df
 
 def fetch_twitter_mentions_nitter(
     query: str = "Matiks",
@@ -78,36 +220,46 @@ def fetch_twitter_mentions_nitter(
     - Nitter instances can be down / blocked / rate-limited.
     - HTML structure can change.
 
+    With aiohttp installed all instances are queried concurrently and the first one
+    returning tweets is used; otherwise they are tried in order.
+
     Output schema matches the demo.
     """
+    _require_nitter_deps()
+    bases = base_urls or NITTER_INSTANCES
+    if _http.AVAILABLE:
+        try:
+            return _tweet_frame(_http.run(_search_nitter_race(bases, query, limit)))
+        except RuntimeError:
+            pass  # already inside a running event loop
+    return _tweet_frame(_search_nitter_sequential(bases, query, limit))
+
+
+async def fetch_twitter_mentions_nitter_async(
+    query: str = "Matiks",
+    limit: int = 50,
+    *,
+    base_urls: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """`fetch_twitter_mentions_nitter` for callers already on an event loop (needs aiohttp)."""
+    _require_nitter_deps()
+    return _tweet_frame(await _search_nitter_race(base_urls or NITTER_INSTANCES, query, limit))
+
+
+def _parse_nitter_date(title: str) -> str:
+    """Nitter's tooltip date ("Jan 5, 2026 · 3:04 PM UTC") as ISO-8601; raw text if unparseable."""
+    title = (title or "").strip()
     try:
-        import requests
-        from bs4 import BeautifulSoup
-    except Exception as e:
-        raise ImportError(f"Missing dependency for nitter scrape: {e}") from e
-
-    bases = base_urls or [
-        "https://nitter.net",
-        "https://nitter.poast.org",
-        "https://nitter.privacydev.net",
-    ]
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; MatiksMonitor/1.0)"}
+        return datetime.strptime(title, "%b %d, %Y · %I:%M %p UTC").replace(tzinfo=timezone.utc).isoformat()
+    except ValueError:
+        return title
 
-    all_rows: List[Dict[str, object]] = []
-    for base in bases:
-        try:
-            url = f"{base.rstrip('/')}/search"
-            r = requests.get(url, params={"f": "tweets", "q": query}, headers=headers, timeout=25)
-            if r.status_code != 200 or not r.text:
-                continue
 
-            soup = BeautifulSoup(r.text, "html.parser")
-            items = soup.select(".timeline-item")
-            if not items:
-                continue
+def _parse_count(text: str) -> int:
+    """Stat counter text ("1,234"; blank for zero) as an int."""
+    digits = (text or "").replace(",", "").strip()
+    return int(digits) if digits.isdigit() else 0
 
-            for item in items:
-                # Content
 
 def fetch_twitter_mentions_demo():
     """Demo data – Scope: content, author, timestamps, engagement metrics."""
@@ -187,13 +339,12 @@ if __name__ == "__main__":
         print(f"Found {len(tweets)} tweets about Matiks")
         print(tweets[['username', 'name', 'likeCount', 'retweetCount']].head())
     os.makedirs("output", exist_ok=True)
-    tweets.to_csv("output/twitter_mentions.csv", index=False)
+    _export.write_csv(tweets, "output/twitter_mentions.csv")
 
     html_path = "output/twitter_mentions.html"
     with open(html_path, "w", encoding="utf-8") as f:
         f.write("<meta charset='utf-8'><h1>Twitter/X mentions – Matiks</h1>")
-        f.write(tweets.to_html(index=False, classes="table", border=1))
-        f.write(df.to_html(index=False, classes="table", border=1))
+        f.write(_export.to_html(tweets))
 
     print("Saved Twitter results to output/twitter_mentions.csv")
     print("Open output/twitter_mentions.html in a browser to view as a table.")
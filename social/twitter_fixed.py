@@ -16,11 +16,118 @@ Why API approach:
 - Fallback ensures demo functionality for presentations
 """
 import os
+from contextlib import nullcontext
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 from typing import Optional, Dict, List
 
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    import pyarrow  # noqa: F401  (backs the string columns of the returned frames)
+except ImportError:
+    pyarrow = None
+
+try:
+    import orjson  # optional: faster parsing of the search payload
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # optional: incremental decoding for large fetches
+except ImportError:
+    ijson = None
+
+try:
+    from social import _http
+except ImportError:  # run as a script from inside social/
+    import _http
+
+# Text columns are Arrow strings (one contiguous buffer per column) when pyarrow is
+# available; dates and counts stay NumPy so the aggregator's datetime paths apply.
+_STRING_DTYPE = "string[pyarrow]" if pyarrow is not None else "string"
+_STRING_COLUMNS = ("content", "username", "name", "url")
+
+# With requests-cache installed, identical searches are answered from the SQLite
+# file the other collectors' caches use instead of spending API quota. Search
+# results go stale quickly, so they are only reused for a few minutes.
+HTTP_CACHE_PATH = "cache/http"
+API_CACHE_EXPIRE_S = 300
+
+# Above this many tweets, pages are decoded incrementally with ijson (when installed)
+# rather than materializing each body and its parsed tree. Those fetches skip the
+# response cache, which would otherwise buffer every body.
+STREAM_PARSE_MIN_LIMIT = 500
+
+# Objects pulled out of a search page, keyed by their ijson prefix.
+_PAGE_ITEMS = {"data.item": "tweet", "includes.users.item": "user"}
+
+
+@lru_cache(maxsize=4)
+def _make_session(api_key):
+    """Keep-alive session for api.twitter.com: one TLS handshake per process, not per call."""
+    return _http.make_session(
+        {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"},
+        retries=3,
+        backoff_factor=0.3,
+        cache=dict(
+            cache_name=HTTP_CACHE_PATH,
+            backend="sqlite",
+            expire_after=API_CACHE_EXPIRE_S,
+            allowable_codes=(200,),
+            allowable_methods=("GET",),
+            # The API sends no-store/max-age=0; honouring it would turn expire_after off.
+            cache_control=False,
+        ),
+    )
+
+
+def _get_session(bearer_token=None):
+    """
+    Authorized session for `bearer_token`, or for TWITTER_BEARER_TOKEN when it is None.
+
+    The environment is read on every call, so a token set later is picked up;
+    sessions are cached per resolved token. Returns None when no token is available.
+    """
+    api_key = bearer_token or os.getenv("TWITTER_BEARER_TOKEN")
+    if not api_key:
+        return None
+    return _make_session(api_key)
+
 
-def fetch_twitter_mentions_api(query="Matiks", limit=50, bearer_token=None):
+def _page_items(data):
+    """('tweet' | 'user' | 'next_token', value) pairs of a decoded search page."""
+    for tweet in data.get('data', []):
+        yield 'tweet', tweet
+    for user in data.get('includes', {}).get('users', []):
+        yield 'user', user
+    next_token = data.get('meta', {}).get('next_token')
+    if next_token:
+        yield 'next_token', next_token
+
+
+def _stream_page_items(raw):
+    """Same pairs as `_page_items`, decoded from the response body as it arrives."""
+    builder = root = None
+    for prefix, event, value in ijson.parse(raw):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == root and event == 'end_map':
+                yield _PAGE_ITEMS[root], builder.value
+                builder = None
+        elif event == 'start_map' and prefix in _PAGE_ITEMS:
+            root, builder = prefix, ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == 'meta.next_token':
+            yield 'next_token', value
+
+
+def fetch_twitter_mentions_api(query="Matiks", limit=50, bearer_token=None, force_refresh=False):
     """
     Fetch Twitter/X mentions using Twitter API v2.
     
@@ -28,79 +135,131 @@ def fetch_twitter_mentions_api(query="Matiks", limit=50, bearer_token=None):
         query: Search query (default: "Matiks")
         limit: Maximum number of tweets to fetch
         bearer_token: Twitter API v2 Bearer Token (overrides env var)
+        force_refresh: Bypass cached responses (requests-cache only) and hit the API
     
     Returns:
         DataFrame with columns: content, username, name, date, replyCount, retweetCount, likeCount, url
     """
-    # Get API key from parameter or environment
-    api_key = bearer_token or os.getenv("TWITTER_BEARER_TOKEN")
+    if requests is None:
+        print("Missing dependencies for Twitter API: requests is not installed")
+        return None
     
-    if not api_key:
+    # Authorized session for the parameter's key, else the environment's
+    session = _get_session(bearer_token)
+    
+    if session is None:
         print("Twitter API key not found. Set TWITTER_BEARER_TOKEN environment variable or pass bearer_token parameter")
         return None
     
     try:
-        import requests
-        import json
-        from datetime import datetime, timezone
-        
         # Twitter API v2 endpoint for recent search
         search_url = "https://api.twitter.com/2/tweets/search/recent"
         
         # Query parameters
         params = {
             'query': f"{query} -is:retweet lang:en",  # Search for Matiks, exclude retweets, English only
-            'max_results': min(limit, 100),  # Twitter API limit is 100 per request
-            'tweet.fields': 'created_at,author_id,public_metrics,context_annotations',
+            'tweet.fields': 'created_at,author_id,public_metrics',  # only the fields read below
             'user.fields': 'username,name',
             'expansions': 'author_id'
         }
         
-        headers = {
-            'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json'
-        }
-        
-        response = requests.get(search_url, headers=headers, params=params, timeout=30)
+        # `refresh` is a CachedSession keyword; a plain Session does not accept it.
+        get_kwargs = {'refresh': True} if force_refresh and _http.CACHE_AVAILABLE else {}
         
-        if response.status_code != 200:
-            print(f"Twitter API error: {response.status_code} - {response.text}")
-            return None
-            
-        data = response.json()
+        # Process the response column-wise: one list per output column.
+        contents: List[str] = []
+        usernames: List[str] = []
+        names: List[str] = []
+        dates: List[str] = []
+        replies: List[int] = []
+        retweets: List[int] = []
+        likes: List[int] = []
+        tweet_ids: List[str] = []
         
-        # Process the response
-        tweets = []
-        users = {user['id']: user for user in data.get('includes', {}).get('users', [])}
+        stream = ijson is not None and limit > STREAM_PARSE_MIN_LIMIT
+        # A CachedSession reads the whole body in order to store it, which would undo
+        # the streaming; streamed pages go around the cache.
+        bypass_cache = stream and _http.CACHE_AVAILABLE
+        seen = set()  # ids already collected; pages can overlap
         
-        for tweet in data.get('data', []):
-            user = users.get(tweet.get('author_id'), {})
-            metrics = tweet.get('public_metrics', {})
+        # Recent search returns at most 100 tweets per page; follow `next_token` until
+        # `limit` tweets are collected or the results run out.
+        next_token = None
+        while len(contents) < limit:
+            page_params = dict(params, max_results=min(max(limit - len(contents), 10), 100))
+            if next_token:
+                page_params['next_token'] = next_token
+            
+            no_cache = session.cache_disabled() if bypass_cache else nullcontext()
+            with no_cache, session.get(search_url, params=page_params, timeout=(5, 30),
+                                       stream=stream, **get_kwargs) as response:
+                if response.status_code != 200:
+                    print(f"Twitter API error: {response.status_code} - {response.text}")
+                    if not contents:
+                        return None
+                    break  # keep the pages already fetched
+                
+                if stream:
+                    response.raw.decode_content = True
+                    items = _stream_page_items(response.raw)
+                else:
+                    data = orjson.loads(response.content) if orjson is not None else response.json()
+                    items = _page_items(data)
+                
+                # `includes.users` follows `data` in the body, so authors are resolved
+                # once the whole page has been read.
+                page_authors = []
+                id_to_username = {}
+                id_to_name = {}
+                next_token = None
+                for kind, item in items:
+                    if kind == 'tweet':
+                        tid = item.get('id', '')
+                        if len(contents) >= limit or tid in seen:
+                            continue
+                        seen.add(tid)
+                        metrics = item.get('public_metrics', {})
+                        contents.append(item.get('text', ''))
+                        page_authors.append(item.get('author_id'))
+                        dates.append(item.get('created_at', ''))
+                        replies.append(metrics.get('reply_count', 0))
+                        retweets.append(metrics.get('retweet_count', 0))
+                        likes.append(metrics.get('like_count', 0))
+                        tweet_ids.append(tid)
+                    elif kind == 'user':
+                        id_to_username[item['id']] = item.get('username', '')
+                        id_to_name[item['id']] = item.get('name', '')
+                    else:
+                        next_token = item
             
-            tweets.append({
-                'content': tweet.get('text', ''),
-                'username': user.get('username', ''),
-                'name': user.get('name', ''),
-                'date': tweet.get('created_at', ''),
-                'replyCount': metrics.get('reply_count', 0),
-                'retweetCount': metrics.get('retweet_count', 0),
-                'likeCount': metrics.get('like_count', 0),
-                'url': f"https://twitter.com/{user.get('username', '')}/status/{tweet.get('id', '')}"
-            })
+            usernames.extend(id_to_username.get(aid, '') for aid in page_authors)
+            names.extend(id_to_name.get(aid, '') for aid in page_authors)
+            if not next_token:
+                break
         
-        return pd.DataFrame(tweets)
+        df = pd.DataFrame({
+            'content': pd.Series(contents, dtype=_STRING_DTYPE),
+            'username': pd.Series(usernames, dtype=_STRING_DTYPE),
+            'name': pd.Series(names, dtype=_STRING_DTYPE),
+            'date': pd.to_datetime(dates, utc=True, errors='coerce', format='ISO8601'),
+            'replyCount': np.asarray(replies, dtype=np.int32),
+            'retweetCount': np.asarray(retweets, dtype=np.int32),
+            'likeCount': np.asarray(likes, dtype=np.int32),
+        })
+        # One vectorized concatenation instead of an f-string per tweet.
+        df['url'] = ('https://twitter.com/' + df['username']
+                     + '/status/' + pd.Series(tweet_ids, dtype=_STRING_DTYPE, index=df.index))
+        return df
         
-    except ImportError as e:
-        print(f"Missing dependencies for Twitter API: {e}")
-        return None
     except Exception as e:
         print(f"Twitter API request failed: {e}")
         return None
 
 
-def fetch_twitter_mentions_demo():
-    """Demo data – Scope: content, author, timestamps, engagement metrics."""
-    data = [
+# Demo data – Scope: content, author, timestamps, engagement metrics. Built once at
+# import with the same dtypes as the API path; callers get a copy.
+_DEMO_DF = pd.DataFrame(
+    [
         {
             "content": "Just hit 1500 rating on @Matiks! Anyone else finding the new update challenging? The math problems are getting harder but more rewarding. #Matiks #MathPractice",
             "username": "tech_enthusiast",
@@ -142,7 +301,17 @@ def fetch_twitter_mentions_demo():
             "url": "https://twitter.com/edutech_daily/status/1234567893"
         },
     ]
-    return pd.DataFrame(data)
+)
+_DEMO_DF["date"] = pd.to_datetime(_DEMO_DF["date"], utc=True)
+_DEMO_DF = _DEMO_DF.astype(
+    {"replyCount": np.int32, "retweetCount": np.int32, "likeCount": np.int32,
+     **dict.fromkeys(_STRING_COLUMNS, _STRING_DTYPE)}
+)
+
+
+def fetch_twitter_mentions_demo():
+    """Demo data – Scope: content, author, timestamps, engagement metrics."""
+    return _DEMO_DF.copy()
 
 
 def fetch_twitter_mentions(query="Matiks", limit=50, bearer_token=None):
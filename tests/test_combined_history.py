@@ -0,0 +1,76 @@
+"""
+Regression checks for reading the combined history back into a cycle.
+
+Run from the repository root with:
+    python -m unittest discover tests
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import aggregator  # noqa: E402
+
+
+def _drop_log_handlers():
+    """Close the monitor.log handlers so the temporary output dir can be removed."""
+    logger = logging.getLogger("matiks_monitor")
+    for handler in list(logger.handlers):
+        target = getattr(handler, "target", None)
+        logger.removeHandler(handler)
+        handler.close()
+        if target is not None:
+            target.close()
+
+
+class LegacyCsvHistoryTest(unittest.TestCase):
+    def test_cycle_without_new_rows_over_csv_only_history(self):
+        """A legacy combined.csv (no Parquet copy) with blank app versions must still save."""
+        legacy = pd.DataFrame(
+            {
+                "platform": ["Reddit", "Google Play"],
+                "type": ["social", "review"],
+                "author": ["a", "b"],
+                "url": ["https://reddit.com/r/x/1", ""],
+                "timestamp": ["2026-02-02 04:29:04+00:00", "2026-02-01 23:11:18+00:00"],
+                "engagement_likes": [3, 0],
+                "engagement_comments": [1, 0],
+                "engagement_shares": [0, 0],
+                "text": ["Matiks app is fun", "crazy app for sharping mind"],
+                "rating": ["", "5.0"],
+                "app_version": ["", ""],
+                "sentiment_polarity": [0.3, 0.3],
+                "sentiment_subjectivity": [0.2, 0.9],
+                "sentiment_label": ["positive", "positive"],
+            }
+        )
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as out:
+            legacy.to_csv(os.path.join(out, "combined.csv"), index=False)
+            argv = ["aggregator.py", "--once", "--output-dir", out]
+            try:
+                os.chdir(out)  # update_status_file writes status.json to the cwd
+                with mock.patch.object(aggregator, "run_once", return_value=pd.DataFrame()), \
+                        mock.patch.object(sys, "argv", argv):
+                    aggregator.main()
+            finally:
+                os.chdir(cwd)
+                _drop_log_handlers()
+
+            with open(os.path.join(out, "last_run.json"), encoding="utf-8") as f:
+                status = json.load(f)
+            self.assertTrue(status["ok"], status.get("error"))
+            self.assertEqual(status["rows_new"], 0)
+            self.assertEqual(status["rows_total"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()